@@ -4,7 +4,7 @@
  * Demonstrates fundamental vault operations using the Node.js bindings.
  */
 
-import { Vault } from '@vaultiel/node';
+import { GlobMatcher, Vault } from '@vaultiel/node';
 import * as fs from 'fs';
 import * as os from 'os';
 import * as path from 'path';
@@ -114,6 +114,13 @@ Related to [[Welcome]] and [[Getting Started]].
     matching.forEach(note => console.log(`  - ${note}`));
     console.log();
 
+    // Compile patterns once when matching repeatedly
+    const matcher = new GlobMatcher(['Project*', 'Getting*']);
+    console.log("Notes matching 'Project*' or 'Getting*':");
+    matcher.list(vault).forEach(note => console.log(`  - ${note}`));
+    console.log(`Welcome.md matches: ${matcher.isMatch('Welcome.md')}`);
+    console.log();
+
     // --- Reading Content ---
     console.log('--- Reading Content ---');
 
@@ -9,6 +9,25 @@ import * as fs from 'fs';
 import * as os from 'os';
 import * as path from 'path';
 
+/** Map each distinct value to the number of times it occurs. */
+function countValues(values: Iterable<string>): Map<string, number> {
+    const counts = new Map<string, number>();
+    for (const value of values) {
+        counts.set(value, (counts.get(value) ?? 0) + 1);
+    }
+    return counts;
+}
+
+/**
+ * Look up a link target in the resolver map: lowercase, without a `.md`
+ * extension. Only own keys count, so `[[constructor]]` is not resolved to
+ * `Object.prototype.constructor`.
+ */
+function resolveTarget(resolver: Record<string, string>, target: string): string | undefined {
+    const key = target.toLowerCase().replace(/\.md$/, '');
+    return Object.hasOwn(resolver, key) ? resolver[key] : undefined;
+}
+
 function createDemoVault(vault: Vault): void {
     vault.createNote(
         'Hub.md',
@@ -130,26 +149,24 @@ function main() {
     // --- Build Complete Link Graph ---
     console.log('--- Building Complete Link Graph ---');
 
-    const graph = new Map<string, string[]>();
     const allNotes = vault.listNotes();
-
-    for (const note of allNotes) {
-        const links = vault.getLinks(note);
-        const targets: string[] = [];
-
-        for (const link of links) {
-            if (!link.embed) {
-                try {
-                    const target = vault.resolveNote(link.target);
-                    targets.push(target);
-                } catch {
-                    // Broken link
-                }
-            }
-        }
-
-        graph.set(note, targets);
-    }
+    const allLinks = vault.getLinksBulk(allNotes);
+    const resolver = vault.getResolverMap();
+
+    // Every path string from the binding is a fresh copy; map resolved
+    // targets back to the listNotes() instances so all maps below share them
+    const canonical = new Map(allNotes.map(note => [note, note]));
+
+    // Resolve each note's targets in one pass, skipping embeds and broken links
+    const graph = new Map<string, string[]>(
+        allNotes.map(note => [
+            note,
+            allLinks[note].flatMap(link => {
+                const resolved = link.embed ? undefined : resolveTarget(resolver, link.target);
+                return resolved === undefined ? [] : [canonical.get(resolved) ?? resolved];
+            }),
+        ])
+    );
 
     console.log('Link graph (source -> targets):');
     for (const [source, targets] of Array.from(graph.entries()).sort()) {
@@ -160,19 +177,10 @@ function main() {
 
     // --- Calculate Incoming Link Counts ---
     console.log('--- Incoming Link Counts ---');
-    const incomingCounts = new Map<string, number>();
-
-    // Initialize all notes with 0
-    for (const note of allNotes) {
-        incomingCounts.set(note, 0);
-    }
+    const linkCounts = countValues(Array.from(graph.values()).flat());
 
-    // Count incoming links
-    for (const targets of graph.values()) {
-        for (const target of targets) {
-            incomingCounts.set(target, (incomingCounts.get(target) || 0) + 1);
-        }
-    }
+    // Include every note, with 0 for notes nothing links to
+    const incomingCounts = new Map(allNotes.map(note => [note, linkCounts.get(note) ?? 0]));
 
     // Sort by count
     const sortedCounts = Array.from(incomingCounts.entries()).sort((a, b) => b[1] - a[1]);
@@ -189,9 +197,10 @@ function main() {
 
     // --- Find Orphans (Alternative Method) ---
     console.log('--- Finding Orphans (Alternative Method) ---');
+    const backlinks = vault.getBacklinkIndex();
     const orphanNotes: string[] = [];
     for (const note of allNotes) {
-        const noteIncoming = vault.getIncomingLinks(note);
+        const noteIncoming = backlinks[note] ?? [];
         if (noteIncoming.length === 0) {
             orphanNotes.push(note);
         }
@@ -201,15 +210,9 @@ function main() {
 
     // --- Analyze Link Contexts ---
     console.log('--- Link Context Analysis ---');
-    const contextCounts = new Map<string, number>();
-
-    for (const note of allNotes) {
-        const noteIncoming = vault.getIncomingLinks(note);
-        for (const ref of noteIncoming) {
-            const ctx = ref.context.includes(':') ? ref.context.split(':')[0] : ref.context;
-            contextCounts.set(ctx, (contextCounts.get(ctx) || 0) + 1);
-        }
-    }
+    const contextCounts = countValues(
+        allNotes.flatMap(note => (backlinks[note] ?? []).map(ref => ref.context.split(':')[0]))
+    );
 
     console.log('Links by context:');
     const sortedContexts = Array.from(contextCounts.entries()).sort((a, b) => b[1] - a[1]);
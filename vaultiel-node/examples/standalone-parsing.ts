@@ -6,10 +6,9 @@
  */
 
 import {
+    parseAll,
     parseLinks,
     parseContentTags,
-    parseContentHeadings,
-    parseContentBlockIds,
 } from '@vaultiel/node';
 
 function main() {
@@ -76,9 +75,11 @@ That's all! See [[Introduction]] to go back.
     console.log('-'.repeat(40));
     console.log(content.substring(0, 500) + '...\n');
 
+    // Parse links, tags, headings and block IDs in a single call
+    const { links, tags, headings, blockIds: blocks } = parseAll(content);
+
     // --- Parse Links ---
     console.log('--- Parsing Links ---');
-    const links = parseLinks(content);
     console.log(`Found ${links.length} links:\n`);
 
     for (const link of links) {
@@ -99,7 +100,6 @@ That's all! See [[Introduction]] to go back.
 
     // --- Parse Tags ---
     console.log('--- Parsing Tags ---');
-    const tags = parseContentTags(content);
     console.log(`Found ${tags.length} tags:\n`);
 
     for (const tag of tags) {
@@ -109,7 +109,6 @@ That's all! See [[Introduction]] to go back.
 
     // --- Parse Headings ---
     console.log('--- Parsing Headings ---');
-    const headings = parseContentHeadings(content);
     console.log(`Found ${headings.length} headings:\n`);
 
     for (const h of headings) {
@@ -121,7 +120,6 @@ That's all! See [[Introduction]] to go back.
 
     // --- Parse Block IDs ---
     console.log('--- Parsing Block IDs ---');
-    const blocks = parseContentBlockIds(content);
     console.log(`Found ${blocks.length} block IDs:\n`);
 
     for (const block of blocks) {
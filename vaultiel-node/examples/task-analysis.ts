@@ -4,11 +4,33 @@
  * Demonstrates how to extract, filter, and analyze tasks from a vault.
  */
 
-import { Vault, Task } from '@vaultiel/node';
+import { Vault, TaskColumns, TaskConfig } from '@vaultiel/node';
 import * as fs from 'fs';
 import * as os from 'os';
 import * as path from 'path';
 
+// Obsidian Tasks-style emoji fields. Tasks carry no metadata unless the
+// vault is opened with a config describing it.
+const TASK_CONFIG: TaskConfig = {
+    fields: [
+        { emoji: '⏳', fieldName: 'scheduled', valueType: 'date', order: 10 },
+        { emoji: '📅', fieldName: 'due', valueType: 'date', order: 11 },
+        { emoji: '✅', fieldName: 'done', valueType: 'date', order: 12 },
+        { emoji: '⏫', fieldName: 'priority', valueType: 'enum', value: 'high', order: 20 },
+        { emoji: '🔼', fieldName: 'priority', valueType: 'enum', value: 'medium', order: 21 },
+        { emoji: '🔽', fieldName: 'priority', valueType: 'enum', value: 'low', order: 22 },
+    ],
+};
+
+/** Map each distinct value to the number of times it occurs. */
+function countValues(values: Iterable<string>): Map<string, number> {
+    const counts = new Map<string, number>();
+    for (const value of values) {
+        counts.set(value, (counts.get(value) ?? 0) + 1);
+    }
+    return counts;
+}
+
 function formatDate(date: Date): string {
     return date.toISOString().split('T')[0];
 }
@@ -90,19 +112,17 @@ status: planning
     );
 }
 
-function analyzeTasks(tasks: Task[]): void {
-    if (tasks.length === 0) {
+function analyzeTasks(columns: TaskColumns): void {
+    const total = columns.line.length;
+    if (total === 0) {
         console.log('No tasks to analyze.');
         return;
     }
 
     // Count by status
-    const statusCounts = new Map<string, number>();
-    for (const task of tasks) {
-        statusCounts.set(task.symbol, (statusCounts.get(task.symbol) || 0) + 1);
-    }
+    const statusCounts = countValues(columns.symbol);
 
-    console.log(`Total tasks: ${tasks.length}`);
+    console.log(`Total tasks: ${total}`);
     console.log('By status:');
     const statusLabels: Record<string, string> = {
         '[ ]': 'Todo',
@@ -116,23 +136,32 @@ function analyzeTasks(tasks: Task[]): void {
     }
 
     // Count by priority
-    const priorityCounts = new Map<string, number>();
-    for (const task of tasks) {
-        const priority = task.priority || 'none';
-        priorityCounts.set(priority, (priorityCounts.get(priority) || 0) + 1);
-    }
+    const priorityCounts = countValues(columns.metadata.priority.map(value => value || 'none'));
 
     console.log('By priority:');
     for (const [priority, count] of Array.from(priorityCounts.entries()).sort()) {
         console.log(`  ${priority}: ${count}`);
     }
 
-    // Count by file
-    const fileCounts = new Map<string, number>();
-    for (const task of tasks) {
-        fileCounts.set(task.file, (fileCounts.get(task.file) || 0) + 1);
+    // Count by due date; the day columns are plain numbers, so no date parsing here
+    const todayDays = Math.floor(Date.parse(formatDate(new Date())) / 86_400_000);
+    const dueCounts = countValues(
+        columns.metadataDays.due.map(days => {
+            if (days === null || days === undefined) return 'no due date';
+            if (days < todayDays) return 'overdue';
+            if (days === todayDays) return 'today';
+            return days - todayDays <= 7 ? 'within a week' : 'later';
+        })
+    );
+
+    console.log('By due date:');
+    for (const [bucket, count] of Array.from(dueCounts.entries()).sort()) {
+        console.log(`  ${bucket}: ${count}`);
     }
 
+    // Count by file
+    const fileCounts = countValues(columns.file);
+
     console.log('By file:');
     const sortedFiles = Array.from(fileCounts.entries()).sort((a, b) => b[1] - a[1]);
     for (const [file, count] of sortedFiles) {
@@ -145,31 +174,44 @@ function main() {
     console.log('=== Vaultiel Node.js Demo: Task Analysis ===');
     console.log(`Using vault: ${vaultPath}\n`);
 
-    const vault = new Vault(vaultPath);
+    const vault = new Vault(vaultPath, TASK_CONFIG);
     createDemoVault(vault);
     console.log('Created demo vault with tasks\n');
 
+    // Compute the date cutoff once and build every filtered view in one scan.
+    // The summary statistics below come from getTaskColumns, a second scan.
     const today = formatDate(new Date());
-    const tomorrow = formatDate(new Date(Date.now() + 24 * 60 * 60 * 1000));
+    const [
+        incomplete,
+        dueToday,
+        overdue,
+        highPriority,
+        scheduled,
+        hasDue,
+        tasksWithTags,
+        tasksWithBlocks,
+    ] = vault.queryTasksBatch([
+        { symbol: '[ ]' },
+        { symbol: '[ ]', fieldEquals: { due: today } },
+        { symbol: '[ ]', fieldBefore: { due: today } },
+        { symbol: '[ ]', fieldEquals: { priority: 'high' } },
+        { symbol: '[ ]', hasFields: ['scheduled'] },
+        { symbol: '[ ]', hasFields: ['due'] },
+        { hasTags: true },
+        { hasBlockId: true },
+    ]);
 
     // --- Get All Tasks ---
     console.log('--- All Tasks ---');
-    const allTasks: Task[] = [];
-    for (const note of vault.listNotes()) {
-        const tasks = vault.getTasks(note);
-        allTasks.push(...tasks);
-    }
-
-    analyzeTasks(allTasks);
+    analyzeTasks(vault.getTaskColumns());
     console.log();
 
     // --- Incomplete Tasks ---
     console.log('--- Incomplete Tasks ---');
-    const incomplete = allTasks.filter(t => t.symbol === '[ ]');
     console.log(`Found ${incomplete.length} incomplete tasks:`);
     incomplete.slice(0, 5).forEach(task => {
         console.log(`  ○ ${task.description}`);
-        if (task.due) console.log(`      Due: ${task.due}`);
+        if (task.metadata.due) console.log(`      Due: ${task.metadata.due}`);
     });
     if (incomplete.length > 5) {
         console.log(`  ... and ${incomplete.length - 5} more`);
@@ -178,10 +220,9 @@ function main() {
 
     // --- Tasks Due Today ---
     console.log('--- Tasks Due Today ---');
-    const dueToday = incomplete.filter(t => t.due === today);
     console.log(`Tasks due ${today}:`);
     dueToday.forEach(task => {
-        const priority = task.priority ? ` [${task.priority}]` : '';
+        const priority = task.metadata.priority ? ` [${task.metadata.priority}]` : '';
         console.log(`  ○ ${task.description}${priority}`);
         console.log(`      File: ${task.file}`);
     });
@@ -189,11 +230,10 @@ function main() {
 
     // --- Overdue Tasks ---
     console.log('--- Overdue Tasks ---');
-    const overdue = incomplete.filter(t => t.due && t.due < today);
     if (overdue.length > 0) {
         console.log(`Found ${overdue.length} overdue tasks:`);
         overdue.forEach(task => {
-            console.log(`  ⚠ ${task.description} (due: ${task.due})`);
+            console.log(`  ⚠ ${task.description} (due: ${task.metadata.due})`);
         });
     } else {
         console.log('No overdue tasks!');
@@ -202,7 +242,6 @@ function main() {
 
     // --- High Priority Tasks ---
     console.log('--- High Priority Tasks ---');
-    const highPriority = incomplete.filter(t => t.priority === 'high');
     console.log(`High priority tasks (${highPriority.length}):`);
     highPriority.forEach(task => {
         console.log(`  ⏫ ${task.description}`);
@@ -223,7 +262,6 @@ function main() {
 
     // --- Tasks with Tags ---
     console.log('--- Tasks with Tags ---');
-    const tasksWithTags = allTasks.filter(t => t.tags.length > 0);
     console.log(`Tasks containing tags (${tasksWithTags.length}):`);
     tasksWithTags.forEach(task => {
         const tagsStr = task.tags.join(', ');
@@ -234,7 +272,6 @@ function main() {
 
     // --- Tasks with Block IDs ---
     console.log('--- Tasks with Block IDs ---');
-    const tasksWithBlocks = allTasks.filter(t => t.blockId);
     console.log(`Tasks with block references (${tasksWithBlocks.length}):`);
     tasksWithBlocks.forEach(task => {
         console.log(`  ○ ${task.description}`);
@@ -244,8 +281,6 @@ function main() {
 
     // --- Scheduled vs Due ---
     console.log('--- Scheduled vs Due ---');
-    const scheduled = incomplete.filter(t => t.scheduled);
-    const hasDue = incomplete.filter(t => t.due);
     console.log(`Tasks with scheduled date: ${scheduled.length}`);
     console.log(`Tasks with due date: ${hasDue.length}`);
     console.log();
@@ -4,17 +4,19 @@
 
 #![deny(clippy::all)]
 
+use chrono::NaiveDate;
 use napi::bindgen_prelude::*;
 use napi_derive::napi;
+use rayon::prelude::*;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::path::PathBuf;
 
 use vaultiel::config::{EmojiFieldDef, EmojiValueType, TaskConfig};
-use vaultiel::graph::LinkGraph;
+use vaultiel::graph::{build_resolver_map, IncomingLink, LinkGraph};
 use vaultiel::metadata::{find_by_id, get_metadata, init_metadata};
-use vaultiel::parser::{parse_all_links, parse_block_ids, parse_headings, parse_tags, parse_task_trees, parse_tasks};
-use vaultiel::Vault;
+use vaultiel::parser::{parse_all_links, parse_block_ids, parse_content, parse_headings, parse_tags, parse_task_trees, parse_tasks};
+use vaultiel::{GlobMatcher, TaskFilter, Vault};
 
 // ============================================================================
 // Types for JavaScript
@@ -41,6 +43,19 @@ pub struct JsLink {
     pub line: u32,
 }
 
+impl From<vaultiel::Link> for JsLink {
+    fn from(l: vaultiel::Link) -> Self {
+        JsLink {
+            target: l.target,
+            alias: l.alias,
+            heading: l.heading,
+            block_id: l.block_id,
+            embed: l.embed,
+            line: l.line as u32,
+        }
+    }
+}
+
 #[napi(object)]
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct JsTag {
@@ -48,6 +63,15 @@ pub struct JsTag {
     pub line: u32,
 }
 
+impl From<vaultiel::Tag> for JsTag {
+    fn from(t: vaultiel::Tag) -> Self {
+        JsTag {
+            name: t.name,
+            line: t.line as u32,
+        }
+    }
+}
+
 #[napi(object)]
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct JsHeading {
@@ -57,6 +81,17 @@ pub struct JsHeading {
     pub slug: String,
 }
 
+impl From<vaultiel::Heading> for JsHeading {
+    fn from(h: vaultiel::Heading) -> Self {
+        JsHeading {
+            text: h.text,
+            level: h.level as u32,
+            line: h.line as u32,
+            slug: h.slug,
+        }
+    }
+}
+
 #[napi(object)]
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct JsBlockId {
@@ -65,6 +100,26 @@ pub struct JsBlockId {
     pub block_type: String,
 }
 
+impl From<vaultiel::BlockId> for JsBlockId {
+    fn from(b: vaultiel::BlockId) -> Self {
+        JsBlockId {
+            id: b.id,
+            line: b.line as u32,
+            block_type: format!("{:?}", b.block_type).to_lowercase(),
+        }
+    }
+}
+
+/// Result of `parseAll`: everything the standalone parsers extract, from one call.
+#[napi(object)]
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct JsParsedContent {
+    pub links: Vec<JsLink>,
+    pub tags: Vec<JsTag>,
+    pub headings: Vec<JsHeading>,
+    pub block_ids: Vec<JsBlockId>,
+}
+
 #[napi(object)]
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct JsTaskLink {
@@ -88,6 +143,96 @@ pub struct JsTask {
     pub block_id: Option<String>,
 }
 
+impl From<vaultiel::Task> for JsTask {
+    fn from(t: vaultiel::Task) -> Self {
+        JsTask {
+            file: t.location.file.to_string_lossy().to_string(),
+            line: t.location.line as u32,
+            raw: t.raw,
+            marker: t.marker,
+            symbol: t.symbol,
+            description: t.description,
+            indent: t.indent as u32,
+            metadata: t.metadata,
+            links: t.links.into_iter().map(|l| JsTaskLink {
+                to: l.to,
+                alias: l.alias,
+            }).collect(),
+            tags: t.tags,
+            block_id: t.block_id,
+        }
+    }
+}
+
+/// Tasks in column-major form: entry `i` of every column describes task `i`.
+#[napi(object)]
+#[derive(Debug, Clone, Default, Serialize, Deserialize)]
+pub struct JsTaskColumns {
+    pub file: Vec<String>,
+    pub line: Vec<u32>,
+    pub symbol: Vec<String>,
+    pub description: Vec<String>,
+    pub indent: Vec<u32>,
+    pub tags: Vec<Vec<String>>,
+    pub block_id: Vec<Option<String>>,
+    /// One column per metadata field of the task config (null where unset).
+    pub metadata: HashMap<String, Vec<Option<String>>>,
+    /// One column per date field, as days since 1970-01-01 (null where unset
+    /// or not a valid YYYY-MM-DD date), for numeric comparisons in JS.
+    pub metadata_days: HashMap<String, Vec<Option<i32>>>,
+}
+
+/// Convert a YYYY-MM-DD date to days since the Unix epoch.
+fn epoch_days(date: &str) -> Option<i32> {
+    let date = NaiveDate::parse_from_str(date, "%Y-%m-%d").ok()?;
+    let epoch = NaiveDate::from_ymd_opt(1970, 1, 1)?;
+    i32::try_from(date.signed_duration_since(epoch).num_days()).ok()
+}
+
+impl JsTaskColumns {
+    fn from_tasks(tasks: Vec<vaultiel::Task>, config: &TaskConfig) -> Self {
+        let n = tasks.len();
+        let mut cols = JsTaskColumns {
+            file: Vec::with_capacity(n),
+            line: Vec::with_capacity(n),
+            symbol: Vec::with_capacity(n),
+            description: Vec::with_capacity(n),
+            indent: Vec::with_capacity(n),
+            tags: Vec::with_capacity(n),
+            block_id: Vec::with_capacity(n),
+            metadata: config
+                .fields
+                .iter()
+                .map(|f| (f.field_name.clone(), Vec::with_capacity(n)))
+                .collect(),
+            metadata_days: config
+                .fields
+                .iter()
+                .filter(|f| f.value_type == EmojiValueType::Date)
+                .map(|f| (f.field_name.clone(), Vec::with_capacity(n)))
+                .collect(),
+        };
+
+        for mut t in tasks {
+            cols.file.push(t.location.file.to_string_lossy().to_string());
+            cols.line.push(t.location.line as u32);
+            cols.symbol.push(t.symbol);
+            cols.description.push(t.description);
+            cols.indent.push(t.indent as u32);
+            cols.tags.push(t.tags);
+            cols.block_id.push(t.block_id);
+            for (field, column) in cols.metadata_days.iter_mut() {
+                column.push(t.metadata.get(field).and_then(|v| epoch_days(v)));
+            }
+            for (field, column) in cols.metadata.iter_mut() {
+                column.push(t.metadata.remove(field));
+            }
+        }
+
+        cols
+    }
+}
+
 #[napi(object)]
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct JsVaultielMetadata {
@@ -107,6 +252,20 @@ pub struct JsLinkRef {
     pub embed: bool,
 }
 
+impl From<&IncomingLink> for JsLinkRef {
+    fn from(l: &IncomingLink) -> Self {
+        JsLinkRef {
+            from: l.from.to_string_lossy().to_string(),
+            line: l.link.line as u32,
+            context: l.context.as_string(),
+            alias: l.link.alias.clone(),
+            heading: l.link.heading.clone(),
+            block_id: l.link.block_id.clone(),
+            embed: l.link.embed,
+        }
+    }
+}
+
 #[napi(object)]
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct JsInlineProperty {
@@ -201,6 +360,52 @@ fn js_config_to_rust(js_config: &JsTaskConfig) -> TaskConfig {
     }
 }
 
+/// Criteria for `queryTasks` and `queryTasksBatch`. Omitted fields do not
+/// constrain the result.
+#[napi(object)]
+#[derive(Debug, Clone, Default)]
+pub struct JsTaskFilter {
+    /// Required task symbol (e.g., "[ ]").
+    pub symbol: Option<String>,
+    /// Metadata fields that must be present.
+    pub has_fields: Option<Vec<String>>,
+    /// Metadata fields that must equal the given value.
+    pub field_equals: Option<HashMap<String, String>>,
+    /// Metadata fields that must sort before the given value (ISO dates compare chronologically).
+    pub field_before: Option<HashMap<String, String>>,
+    /// Only match tasks containing at least one tag.
+    pub has_tags: Option<bool>,
+    /// Only match tasks with a block ID.
+    pub has_block_id: Option<bool>,
+}
+
+/// Convert JS task filter to Rust TaskFilter
+fn js_filter_to_rust(filter: JsTaskFilter) -> TaskFilter {
+    TaskFilter {
+        symbol: filter.symbol,
+        has_fields: filter.has_fields.unwrap_or_default(),
+        field_equals: filter.field_equals.unwrap_or_default(),
+        field_before: filter.field_before.unwrap_or_default(),
+        has_tags: filter.has_tags.unwrap_or(false),
+        has_block_id: filter.has_block_id.unwrap_or(false),
+    }
+}
+
+/// Parse tasks from every note in parallel, in note-path order.
+/// Notes that cannot be read are skipped.
+fn parse_vault_tasks(vault: &Vault, config: &TaskConfig) -> Result<Vec<vaultiel::Task>> {
+    let notes = vault.list_notes()
+        .map_err(|e| Error::from_reason(e.to_string()))?;
+
+    Ok(notes
+        .par_iter()
+        .flat_map_iter(|path| match vault.load_note(path) {
+            Ok(note) => parse_tasks(&note.content, path, config),
+            Err(_) => Vec::new(),
+        })
+        .collect())
+}
+
 // ============================================================================
 // Task tree JSON serialization (camelCase, flattened location)
 // ============================================================================
@@ -328,14 +533,19 @@ impl JsVault {
         let note_path = self.vault.normalize_note_path(&path);
         let note = self.vault.load_note(&note_path)
             .map_err(|e| Error::from_reason(e.to_string()))?;
-        Ok(note.body().to_string())
+
+        // The body is a suffix of the content; trim in place rather than copy
+        let body_start = note.content.len() - note.body().len();
+        let mut content = note.content;
+        content.drain(..body_start);
+        Ok(content)
     }
 
     /// Get note frontmatter as JSON.
     #[napi]
     pub fn get_frontmatter(&self, path: String) -> Result<Option<String>> {
         let note_path = self.vault.normalize_note_path(&path);
-        let note = self.vault.load_note(&note_path)
+        let note = self.vault.load_note_frontmatter(&note_path)
             .map_err(|e| Error::from_reason(e.to_string()))?;
 
         match note.frontmatter() {
@@ -358,7 +568,7 @@ impl JsVault {
 
         let mut entries = Vec::with_capacity(notes.len());
         for path in &notes {
-            if let Ok(note) = self.vault.load_note(path) {
+            if let Ok(note) = self.vault.load_note_frontmatter(path) {
                 if let Ok(Some(fm)) = note.frontmatter() {
                     let entry = serde_json::json!({
                         "path": path.to_string_lossy(),
@@ -415,6 +625,24 @@ impl JsVault {
             .map_err(|e| Error::from_reason(e.to_string()))
     }
 
+    /// Get a map from every name a note can be linked by to its path.
+    ///
+    /// Keys are lowercase and have no `.md` extension: paths, filenames, and
+    /// frontmatter aliases. Resolving many links is then a lookup on
+    /// `target.toLowerCase().replace(/\.md$/, '')` rather than one
+    /// `resolveNote` call per link. The result is a plain object, so check
+    /// `Object.hasOwn` before indexing it with arbitrary link targets.
+    #[napi]
+    pub fn get_resolver_map(&self) -> Result<HashMap<String, String>> {
+        build_resolver_map(&self.vault)
+            .map(|map| {
+                map.into_iter()
+                    .map(|(k, p)| (k, p.to_string_lossy().to_string()))
+                    .collect()
+            })
+            .map_err(|e| Error::from_reason(e.to_string()))
+    }
+
     // ========================================================================
     // Parsing
     // ========================================================================
@@ -427,17 +655,27 @@ impl JsVault {
             .map_err(|e| Error::from_reason(e.to_string()))?;
 
         let links = parse_all_links(&note.content);
-        Ok(links
-            .into_iter()
-            .map(|l| JsLink {
-                target: l.target,
-                alias: l.alias,
-                heading: l.heading,
-                block_id: l.block_id,
-                embed: l.embed,
-                line: l.line as u32,
+        Ok(links.into_iter().map(JsLink::from).collect())
+    }
+
+    /// Parse links from many notes in a single call.
+    ///
+    /// Returns an object mapping each requested path to its links. Notes are
+    /// loaded and parsed in parallel, so walking a whole vault costs one call
+    /// into native code instead of one `getLinks` call per note.
+    #[napi]
+    pub fn get_links_bulk(&self, paths: Vec<String>) -> Result<HashMap<String, Vec<JsLink>>> {
+        let vault = &self.vault;
+        paths
+            .into_par_iter()
+            .map(|path| {
+                let note_path = vault.normalize_note_path(&path);
+                let note = vault.load_note(&note_path)?;
+                let links = parse_all_links(&note.content).into_iter().map(JsLink::from).collect();
+                Ok((path, links))
             })
-            .collect())
+            .collect::<vaultiel::Result<HashMap<_, _>>>()
+            .map_err(|e| Error::from_reason(e.to_string()))
     }
 
     /// Parse tags from a note.
@@ -450,10 +688,7 @@ impl JsVault {
         let tags = parse_tags(&note.content);
         Ok(tags
             .into_iter()
-            .map(|t| JsTag {
-                name: t.name,
-                line: t.line as u32,
-            })
+            .map(JsTag::from)
             .collect())
     }
 
@@ -467,12 +702,7 @@ impl JsVault {
         let headings = parse_headings(&note.content);
         Ok(headings
             .into_iter()
-            .map(|h| JsHeading {
-                text: h.text,
-                level: h.level as u32,
-                line: h.line as u32,
-                slug: h.slug,
-            })
+            .map(JsHeading::from)
             .collect())
     }
 
@@ -486,11 +716,7 @@ impl JsVault {
         let blocks = parse_block_ids(&note.content);
         Ok(blocks
             .into_iter()
-            .map(|b| JsBlockId {
-                id: b.id,
-                line: b.line as u32,
-                block_type: format!("{:?}", b.block_type).to_lowercase(),
-            })
+            .map(JsBlockId::from)
             .collect())
     }
 
@@ -514,23 +740,70 @@ impl JsVault {
             tasks
         };
 
-        Ok(filtered
+        Ok(filtered.into_iter().map(JsTask::from).collect())
+    }
+
+    /// Parse tasks from every note in the vault in one call.
+    ///
+    /// Notes are parsed in parallel and tasks are returned in note-path order.
+    /// Notes that cannot be read are skipped.
+    #[napi]
+    pub fn get_all_tasks(&self) -> Result<Vec<JsTask>> {
+        let tasks = parse_vault_tasks(&self.vault, &self.task_config)?;
+        Ok(tasks.into_iter().map(JsTask::from).collect())
+    }
+
+    /// Parse tasks into columns instead of one object per task.
+    ///
+    /// Reads a single note when `path` is given, otherwise every note in the
+    /// vault. Returning a handful of arrays avoids allocating an object per
+    /// task, which dominates for large vaults.
+    #[napi]
+    pub fn get_task_columns(&self, path: Option<String>) -> Result<JsTaskColumns> {
+        let tasks = match path {
+            Some(path) => {
+                let note_path = self.vault.normalize_note_path(&path);
+                let note = self.vault.load_note(&note_path)
+                    .map_err(|e| Error::from_reason(e.to_string()))?;
+                parse_tasks(&note.content, &note_path, &self.task_config)
+            }
+            None => parse_vault_tasks(&self.vault, &self.task_config)?,
+        };
+        Ok(JsTaskColumns::from_tasks(tasks, &self.task_config))
+    }
+
+    /// Find tasks across the vault that match a filter.
+    ///
+    /// Filtering happens before tasks are converted to JavaScript objects, so
+    /// narrow queries avoid materializing tasks that would be thrown away.
+    #[napi]
+    pub fn query_tasks(&self, filter: JsTaskFilter) -> Result<Vec<JsTask>> {
+        let filter = js_filter_to_rust(filter);
+        let tasks = parse_vault_tasks(&self.vault, &self.task_config)?;
+        Ok(tasks
             .into_iter()
-            .map(|t| JsTask {
-                file: t.location.file.to_string_lossy().to_string(),
-                line: t.location.line as u32,
-                raw: t.raw,
-                marker: t.marker,
-                symbol: t.symbol,
-                description: t.description,
-                indent: t.indent as u32,
-                metadata: t.metadata,
-                links: t.links.into_iter().map(|l| JsTaskLink {
-                    to: l.to,
-                    alias: l.alias,
-                }).collect(),
-                tags: t.tags,
-                block_id: t.block_id,
+            .filter(|t| filter.matches(t))
+            .map(JsTask::from)
+            .collect())
+    }
+
+    /// Run several task filters over a single scan of the vault.
+    ///
+    /// Returns one list per filter, in the same order. Prefer this over
+    /// repeated `queryTasks` calls, each of which re-reads every note.
+    #[napi]
+    pub fn query_tasks_batch(&self, filters: Vec<JsTaskFilter>) -> Result<Vec<Vec<JsTask>>> {
+        let tasks = parse_vault_tasks(&self.vault, &self.task_config)?;
+        Ok(filters
+            .into_iter()
+            .map(|filter| {
+                let filter = js_filter_to_rust(filter);
+                tasks
+                    .iter()
+                    .filter(|t| filter.matches(t))
+                    .cloned()
+                    .map(JsTask::from)
+                    .collect()
             })
             .collect())
     }
@@ -888,6 +1161,15 @@ impl JsVault {
         *self.link_graph.borrow_mut() = None;
     }
 
+    /// Forget all cached vault state: the note listing and the link graph.
+    ///
+    /// Call after changing the vault outside this API, e.g. from another process.
+    #[napi]
+    pub fn invalidate_cache(&self) {
+        self.vault.invalidate_cache();
+        self.invalidate_link_graph();
+    }
+
     /// Get incoming links to a note.
     #[napi]
     pub fn get_incoming_links(&self, path: String) -> Result<Vec<JsLinkRef>> {
@@ -897,16 +1179,25 @@ impl JsVault {
         let graph = cached.as_ref().unwrap();
 
         let incoming = graph.get_incoming(&note_path);
-        Ok(incoming
-            .iter()
-            .map(|l| JsLinkRef {
-                from: l.from.to_string_lossy().to_string(),
-                line: l.link.line as u32,
-                context: l.context.as_string(),
-                alias: l.link.alias.clone(),
-                heading: l.link.heading.clone(),
-                block_id: l.link.block_id.clone(),
-                embed: l.link.embed,
+        Ok(incoming.into_iter().map(JsLinkRef::from).collect())
+    }
+
+    /// Get incoming links for every note in the vault in one call.
+    ///
+    /// Returns an object mapping each note path to the same links
+    /// `getIncomingLinks` would return for it (empty for orphans).
+    #[napi]
+    pub fn get_backlink_index(&self) -> Result<HashMap<String, Vec<JsLinkRef>>> {
+        self.ensure_link_graph()?;
+        let cached = self.link_graph.borrow();
+        let graph = cached.as_ref().unwrap();
+
+        Ok(graph
+            .incoming_index()
+            .into_iter()
+            .map(|(path, incoming)| {
+                let refs = incoming.into_iter().map(JsLinkRef::from).collect();
+                (path.to_string_lossy().to_string(), refs)
             })
             .collect())
     }
@@ -1019,6 +1310,42 @@ impl JsVault {
     }
 }
 
+// ============================================================================
+// Glob Matcher Class
+// ============================================================================
+
+/// Glob patterns compiled once, for filtering notes repeatedly.
+#[napi]
+pub struct JsGlobMatcher {
+    matcher: GlobMatcher,
+}
+
+#[napi]
+impl JsGlobMatcher {
+    /// Compile a matcher that accepts notes matching any of the patterns.
+    #[napi(constructor)]
+    pub fn new(patterns: Vec<String>) -> Result<Self> {
+        let matcher = GlobMatcher::new(&patterns)
+            .map_err(|e| Error::from_reason(e.to_string()))?;
+        Ok(Self { matcher })
+    }
+
+    /// Check whether a vault-relative note path matches.
+    #[napi]
+    pub fn is_match(&self, path: String) -> bool {
+        self.matcher.is_match(&PathBuf::from(path))
+    }
+
+    /// List the notes in a vault that match.
+    #[napi]
+    pub fn list(&self, vault: &JsVault) -> Result<Vec<String>> {
+        self.matcher
+            .list(&vault.vault)
+            .map(|notes| notes.into_iter().map(|p| p.to_string_lossy().to_string()).collect())
+            .map_err(|e| Error::from_reason(e.to_string()))
+    }
+}
+
 // ============================================================================
 // Standalone Functions
 // ============================================================================
@@ -1027,17 +1354,7 @@ impl JsVault {
 #[napi]
 pub fn parse_links(content: String) -> Vec<JsLink> {
     let links = parse_all_links(&content);
-    links
-        .into_iter()
-        .map(|l| JsLink {
-            target: l.target,
-            alias: l.alias,
-            heading: l.heading,
-            block_id: l.block_id,
-            embed: l.embed,
-            line: l.line as u32,
-        })
-        .collect()
+    links.into_iter().map(JsLink::from).collect()
 }
 
 /// Parse tags from markdown content.
@@ -1045,10 +1362,7 @@ pub fn parse_links(content: String) -> Vec<JsLink> {
 pub fn parse_content_tags(content: String) -> Vec<JsTag> {
     let tags = parse_tags(&content);
     tags.into_iter()
-        .map(|t| JsTag {
-            name: t.name,
-            line: t.line as u32,
-        })
+        .map(JsTag::from)
         .collect()
 }
 
@@ -1058,12 +1372,7 @@ pub fn parse_content_headings(content: String) -> Vec<JsHeading> {
     let headings = parse_headings(&content);
     headings
         .into_iter()
-        .map(|h| JsHeading {
-            text: h.text,
-            level: h.level as u32,
-            line: h.line as u32,
-            slug: h.slug,
-        })
+        .map(JsHeading::from)
         .collect()
 }
 
@@ -1073,10 +1382,22 @@ pub fn parse_content_block_ids(content: String) -> Vec<JsBlockId> {
     let blocks = parse_block_ids(&content);
     blocks
         .into_iter()
-        .map(|b| JsBlockId {
-            id: b.id,
-            line: b.line as u32,
-            block_type: format!("{:?}", b.block_type).to_lowercase(),
-        })
+        .map(JsBlockId::from)
         .collect()
 }
+
+/// Parse links, tags, headings and block IDs from markdown content in one call.
+///
+/// Returns the same results as `parseLinks`, `parseContentTags`,
+/// `parseContentHeadings` and `parseContentBlockIds`, but crosses into
+/// Rust once and locates code blocks only once.
+#[napi]
+pub fn parse_all(content: String) -> JsParsedContent {
+    let parsed = parse_content(&content);
+    JsParsedContent {
+        links: parsed.links.into_iter().map(JsLink::from).collect(),
+        tags: parsed.tags.into_iter().map(JsTag::from).collect(),
+        headings: parsed.headings.into_iter().map(JsHeading::from).collect(),
+        block_ids: parsed.block_ids.into_iter().map(JsBlockId::from).collect(),
+    }
+}
@@ -4,11 +4,12 @@ use crate::error::Result;
 use crate::parser::{parse_all_links, parse_frontmatter};
 use crate::types::{Link, LinkContext};
 use crate::vault::Vault;
+use rayon::prelude::*;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
 
-use super::resolution::{resolve_link_target_indexed, build_filename_index, FilenameIndex};
+use super::resolution::{frontmatter_aliases, normalize_target, resolve_link_target_indexed, build_filename_index, FilenameIndex};
 
 /// Information about a link with its context.
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -61,40 +62,41 @@ impl LinkGraph {
         // Single pass: collect aliases and raw content, then build links.
         // We need aliases before resolving links, so we read all notes once,
         // extract aliases first, then process links from the cached content.
+        // Notes are read and parsed in parallel; results are merged in note
+        // order so the graph is the same on every run.
         let notes = vault.list_notes()?;
-        let mut contents: Vec<(PathBuf, String)> = Vec::with_capacity(notes.len());
-
-        for path in &notes {
-            if let Ok(note) = vault.load_note(path) {
-                // Extract aliases from frontmatter
-                if let Ok(Some(fm)) = parse_frontmatter(&note.content) {
-                    if let Some(aliases) = fm.get("aliases") {
-                        if let Some(arr) = aliases.as_sequence() {
-                            for alias in arr {
-                                if let Some(alias_str) = alias.as_str() {
-                                    graph
-                                        .aliases
-                                        .insert(alias_str.to_lowercase(), path.clone());
-                                }
-                            }
-                        } else if let Some(alias_str) = aliases.as_str() {
-                            graph
-                                .aliases
-                                .insert(alias_str.to_lowercase(), path.clone());
-                        }
-                    }
-                }
-                contents.push((path.clone(), note.content));
+        let loaded: Vec<(PathBuf, String, Vec<String>)> = notes
+            .par_iter()
+            .filter_map(|path| {
+                let note = vault.load_note(path).ok()?;
+                let aliases = match parse_frontmatter(&note.content) {
+                    Ok(Some(fm)) => frontmatter_aliases(&fm),
+                    _ => Vec::new(),
+                };
+                Some((path.clone(), note.content, aliases))
+            })
+            .collect();
+
+        for (path, _, aliases) in &loaded {
+            for alias in aliases {
+                graph.aliases.insert(alias.clone(), path.clone());
             }
         }
 
         // Build filename index once for fast link resolution
         let filename_index = build_filename_index(vault);
 
-        // Build link graph from cached content (no second disk pass)
-        for (path, content) in &contents {
-            let links = Self::extract_links_with_context(content, vault, &graph.aliases, &filename_index);
+        // Extract links from cached content (no second disk pass)
+        let aliases = &graph.aliases;
+        let extracted: Vec<(PathBuf, Vec<LinkInfo>)> = loaded
+            .into_par_iter()
+            .map(|(path, content, _)| {
+                let links = Self::extract_links_with_context(&content, vault, aliases, &filename_index);
+                (path, links)
+            })
+            .collect();
 
+        for (path, links) in extracted {
             // Build incoming index
             for link_info in &links {
                 let target_key = normalize_target(&link_info.link.target);
@@ -112,7 +114,7 @@ impl LinkGraph {
                     .push(incoming_link);
             }
 
-            graph.outgoing.insert(path.clone(), links);
+            graph.outgoing.insert(path, links);
         }
 
         Ok(graph)
@@ -293,17 +295,45 @@ impl LinkGraph {
             }
         }
 
-        // Deduplicate
-        result.sort_by(|a, b| {
-            (&a.from, a.link.line, a.link.start_col).cmp(&(&b.from, b.link.line, b.link.start_col))
-        });
-        result.dedup_by(|a, b| {
-            a.from == b.from && a.link.line == b.link.line && a.link.start_col == b.link.start_col
-        });
-
+        sort_and_dedup_incoming(&mut result);
         result
     }
 
+    /// Get incoming links for every note in the graph in one pass.
+    ///
+    /// Each entry matches what `get_incoming` returns for that note; notes
+    /// without backlinks map to an empty list.
+    pub fn incoming_index(&self) -> HashMap<&PathBuf, Vec<&IncomingLink>> {
+        // Map each key `get_incoming` would try to the notes it names
+        let mut notes_by_key: HashMap<String, Vec<&PathBuf>> = HashMap::new();
+        for path in self.outgoing.keys() {
+            let path_key = normalize_target(&path.to_string_lossy());
+            let stem_key = path
+                .file_stem()
+                .map(|s| s.to_string_lossy().to_lowercase())
+                .unwrap_or_default();
+            if stem_key != path_key {
+                notes_by_key.entry(stem_key).or_default().push(path);
+            }
+            notes_by_key.entry(path_key).or_default().push(path);
+        }
+
+        let mut index: HashMap<&PathBuf, Vec<&IncomingLink>> =
+            self.outgoing.keys().map(|path| (path, Vec::new())).collect();
+        for (key, links) in &self.incoming {
+            for &path in notes_by_key.get(key).into_iter().flatten() {
+                if let Some(result) = index.get_mut(path) {
+                    result.extend(links.iter());
+                }
+            }
+        }
+
+        for result in index.values_mut() {
+            sort_and_dedup_incoming(result);
+        }
+        index
+    }
+
     /// Get all notes that have links.
     pub fn notes_with_links(&self) -> impl Iterator<Item = &PathBuf> {
         self.outgoing.keys()
@@ -315,14 +345,14 @@ impl LinkGraph {
     }
 }
 
-/// Normalize a link target for use as a key.
-fn normalize_target(target: &str) -> String {
-    let target = target.to_lowercase();
-    // Remove .md extension if present
-    target
-        .strip_suffix(".md")
-        .unwrap_or(&target)
-        .to_string()
+/// Order incoming links by source and position, dropping duplicates.
+fn sort_and_dedup_incoming(links: &mut Vec<&IncomingLink>) {
+    links.sort_by(|a, b| {
+        (&a.from, a.link.line, a.link.start_col).cmp(&(&b.from, b.link.line, b.link.start_col))
+    });
+    links.dedup_by(|a, b| {
+        a.from == b.from && a.link.line == b.link.line && a.link.start_col == b.link.start_col
+    });
 }
 
 #[cfg(test)]
@@ -385,6 +415,51 @@ mod tests {
         assert!(incoming.iter().any(|l| l.from == PathBuf::from("Note B.md")));
     }
 
+    #[test]
+    fn test_incoming_index_matches_get_incoming() {
+        let (_temp, vault) = create_test_vault();
+        let graph = LinkGraph::build(&vault).unwrap();
+
+        let index = graph.incoming_index();
+        assert_eq!(index.len(), 3);
+        for (path, incoming) in &index {
+            assert_eq!(incoming.len(), graph.get_incoming(path).len());
+        }
+        assert!(index[&PathBuf::from("Note B.md")]
+            .iter()
+            .any(|l| l.from == PathBuf::from("Note A.md")));
+    }
+
+    #[test]
+    fn test_incoming_index_nested_and_shared_stems() {
+        let (temp, _vault) = create_test_vault();
+        fs::create_dir_all(temp.path().join("proj")).unwrap();
+        fs::write(temp.path().join("proj/Note C.md"), "Nested.\n").unwrap();
+        fs::write(
+            temp.path().join("Links.md"),
+            "[[proj/Note C]] and [[proj/Note C.md]] and [[Note C]]\n",
+        )
+        .unwrap();
+        let vault = Vault::new(temp.path()).unwrap();
+        let graph = LinkGraph::build(&vault).unwrap();
+
+        let positions = |links: &[&IncomingLink]| -> Vec<(PathBuf, usize, usize)> {
+            links
+                .iter()
+                .map(|l| (l.from.clone(), l.link.line, l.link.start_col))
+                .collect()
+        };
+
+        let index = graph.incoming_index();
+        assert_eq!(index.len(), 5);
+        for (path, incoming) in &index {
+            assert_eq!(positions(incoming), positions(&graph.get_incoming(path)), "{:?}", path);
+        }
+        // Both path forms reach the nested note, as do both links by its
+        // filename (the one in Links.md and Note A's [[Note C#heading]])
+        assert_eq!(index[&PathBuf::from("proj/Note C.md")].len(), 4);
+    }
+
     #[test]
     fn test_alias_resolution() {
         let (_temp, vault) = create_test_vault();
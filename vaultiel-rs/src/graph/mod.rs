@@ -4,4 +4,4 @@ mod link_graph;
 pub mod resolution;
 
 pub use link_graph::{IncomingLink, LinkGraph, LinkInfo};
-pub use resolution::resolve_link_target;
+pub use resolution::{build_resolver_map, resolve_link_target, resolve_with_map, ResolverMap};
@@ -5,7 +5,10 @@
 //! 2. Exact filename match (case-insensitive)
 //! 3. Alias match from frontmatter
 
+use crate::error::Result;
+use crate::note::Note;
 use crate::vault::Vault;
+use rayon::prelude::*;
 use std::collections::HashMap;
 use std::path::PathBuf;
 
@@ -39,6 +42,89 @@ pub fn build_filename_index(vault: &Vault) -> FilenameIndex {
     index
 }
 
+/// Pre-computed map from every name a note can be linked by to its path.
+///
+/// Keys are lowercase and have no `.md` extension. They cover vault-relative
+/// paths, filename stems, and frontmatter aliases.
+pub type ResolverMap = HashMap<String, PathBuf>;
+
+/// Build a resolver map for the whole vault.
+///
+/// Only frontmatter is read from each note. When several notes claim the same
+/// key, Obsidian's resolution order decides: paths win over filenames, which
+/// win over aliases.
+pub fn build_resolver_map(vault: &Vault) -> Result<ResolverMap> {
+    let notes = vault.list_notes()?;
+    let mut map = HashMap::with_capacity(notes.len() * 2);
+
+    // Read frontmatter in parallel, then insert in note order so that
+    // duplicate aliases resolve the same way on every run
+    let aliases: Vec<Vec<String>> = notes
+        .par_iter()
+        .map(|note_path| match Note::load_frontmatter_only(&vault.root, note_path) {
+            Ok(note) => match note.frontmatter() {
+                Ok(Some(fm)) => frontmatter_aliases(&fm),
+                _ => Vec::new(),
+            },
+            Err(_) => Vec::new(),
+        })
+        .collect();
+
+    for (note_path, note_aliases) in notes.iter().zip(aliases) {
+        for alias in note_aliases {
+            map.insert(alias, note_path.clone());
+        }
+    }
+
+    for note_path in &notes {
+        if let Some(stem) = note_path.file_stem() {
+            map.insert(stem.to_string_lossy().to_lowercase(), note_path.clone());
+        }
+    }
+
+    for note_path in &notes {
+        let key = note_path.with_extension("").to_string_lossy().to_lowercase();
+        map.insert(key, note_path.clone());
+    }
+
+    Ok(map)
+}
+
+/// Resolve a link target through a pre-built resolver map.
+///
+/// The target is normalized the same way as the link graph's keys: lowercased,
+/// with any `.md` extension removed, so `[[Note.md]]` resolves like `[[Note]]`.
+pub fn resolve_with_map<'a>(target: &str, map: &'a ResolverMap) -> Option<&'a PathBuf> {
+    map.get(&normalize_target(target))
+}
+
+/// Normalize a link target for use as a key.
+pub(crate) fn normalize_target(target: &str) -> String {
+    let target = target.to_lowercase();
+    // Remove .md extension if present
+    target
+        .strip_suffix(".md")
+        .unwrap_or(&target)
+        .to_string()
+}
+
+/// Extract a note's aliases, lowercased, from its parsed frontmatter.
+///
+/// `aliases` may be a list or a single string.
+pub(crate) fn frontmatter_aliases(fm: &serde_yaml::Value) -> Vec<String> {
+    match fm.get("aliases") {
+        Some(aliases) => match aliases.as_sequence() {
+            Some(arr) => arr
+                .iter()
+                .filter_map(|a| a.as_str())
+                .map(|a| a.to_lowercase())
+                .collect(),
+            None => aliases.as_str().map(|a| a.to_lowercase()).into_iter().collect(),
+        },
+        None => Vec::new(),
+    }
+}
+
 /// Resolve a link target using an optional pre-built filename index.
 /// If `filename_index` is None, falls back to scanning vault.list_notes().
 pub fn resolve_link_target_indexed(
@@ -172,6 +258,43 @@ mod tests {
         assert!(!is_media_target("Note.md"));
     }
 
+    #[test]
+    fn test_build_resolver_map() {
+        let temp = tempfile::TempDir::new().unwrap();
+        std::fs::create_dir_all(temp.path().join("proj")).unwrap();
+        std::fs::write(
+            temp.path().join("proj/Alpha.md"),
+            "---\naliases:\n  - First\n  - beta\n---\nBody",
+        )
+        .unwrap();
+        std::fs::write(temp.path().join("Beta.md"), "No frontmatter").unwrap();
+        let vault = Vault::new(temp.path()).unwrap();
+
+        let map = build_resolver_map(&vault).unwrap();
+        assert_eq!(map.get("alpha"), Some(&PathBuf::from("proj/Alpha.md")));
+        assert_eq!(map.get("proj/alpha"), Some(&PathBuf::from("proj/Alpha.md")));
+        assert_eq!(map.get("first"), Some(&PathBuf::from("proj/Alpha.md")));
+        // The filename of Beta.md takes precedence over Alpha's alias.
+        assert_eq!(map.get("beta"), Some(&PathBuf::from("Beta.md")));
+        assert_eq!(map.get("missing"), None);
+    }
+
+    #[test]
+    fn test_resolve_with_map_strips_md_suffix() {
+        let temp = tempfile::TempDir::new().unwrap();
+        std::fs::create_dir_all(temp.path().join("proj")).unwrap();
+        std::fs::write(temp.path().join("proj/Note.md"), "Body").unwrap();
+        let vault = Vault::new(temp.path()).unwrap();
+
+        let map = build_resolver_map(&vault).unwrap();
+        let expected = PathBuf::from("proj/Note.md");
+        assert_eq!(resolve_with_map("Note", &map), Some(&expected));
+        assert_eq!(resolve_with_map("Note.md", &map), Some(&expected));
+        assert_eq!(resolve_with_map("proj/Note.md", &map), Some(&expected));
+        assert_eq!(resolve_with_map("PROJ/NOTE.MD", &map), Some(&expected));
+        assert_eq!(resolve_with_map("Missing.md", &map), None);
+    }
+
     #[test]
     fn test_get_media_type() {
         assert_eq!(get_media_type("image.png"), Some("image"));
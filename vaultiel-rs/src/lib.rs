@@ -46,4 +46,4 @@ pub use error::{Result, VaultError};
 pub use note::Note;
 pub use search::{SearchMatch, SearchQuery, SearchResult};
 pub use types::*;  // includes PropertyScope
-pub use vault::Vault;
+pub use vault::{GlobMatcher, Vault};
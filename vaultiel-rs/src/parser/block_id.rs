@@ -1,7 +1,8 @@
 //! Block ID parsing (^block-id).
 
-use crate::parser::code_block::{find_code_block_ranges, is_line_in_fenced_code_block};
+use crate::parser::code_block::{find_code_block_ranges, is_line_in_fenced_code_block, CodeBlockRange};
 use crate::types::{BlockId, BlockType};
+use memchr::memchr;
 use regex::Regex;
 use std::sync::LazyLock;
 
@@ -13,14 +14,27 @@ static BLOCK_ID: LazyLock<Regex> = LazyLock::new(|| {
 
 /// Parse all block IDs from content.
 pub fn parse_block_ids(content: &str) -> Vec<BlockId> {
-    let code_ranges = find_code_block_ranges(content);
+    // Skip the code block scan entirely for notes without a '^'
+    if memchr(b'^', content.as_bytes()).is_none() {
+        return Vec::new();
+    }
+    parse_block_ids_with_ranges(content, &find_code_block_ranges(content))
+}
+
+/// Parse all block IDs, given precomputed code block ranges.
+pub(crate) fn parse_block_ids_with_ranges(content: &str, code_ranges: &[CodeBlockRange]) -> Vec<BlockId> {
     let mut block_ids = Vec::new();
 
     for (line_idx, line) in content.lines().enumerate() {
         let line_num = line_idx + 1; // 1-indexed
 
         // Skip lines inside fenced code blocks
-        if is_line_in_fenced_code_block(line_num, &code_ranges) {
+        if is_line_in_fenced_code_block(line_num, code_ranges) {
+            continue;
+        }
+
+        // Cheap byte check before running the regex on every line
+        if memchr(b'^', line.as_bytes()).is_none() {
             continue;
         }
 
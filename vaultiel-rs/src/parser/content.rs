@@ -0,0 +1,76 @@
+//! Combined parsing of links, tags, headings and block IDs.
+
+use crate::parser::block_id::parse_block_ids_with_ranges;
+use crate::parser::code_block::find_code_block_ranges;
+use crate::parser::heading::parse_headings_with_ranges;
+use crate::parser::tag::parse_tags_with_ranges;
+use crate::parser::wikilink::parse_all_links_with_ranges;
+use crate::types::{BlockId, Heading, Link, Tag};
+use memchr::memchr3;
+use serde::{Deserialize, Serialize};
+
+/// Links, tags, headings and block IDs extracted from one piece of content.
+#[derive(Debug, Clone, Default, PartialEq, Eq, Serialize, Deserialize)]
+pub struct ParsedContent {
+    /// All wikilinks and embeds.
+    pub links: Vec<Link>,
+    /// All inline tags.
+    pub tags: Vec<Tag>,
+    /// All ATX headings.
+    pub headings: Vec<Heading>,
+    /// All block IDs.
+    pub block_ids: Vec<BlockId>,
+}
+
+/// Parse links, tags, headings and block IDs from content.
+///
+/// Equivalent to calling `parse_all_links`, `parse_tags`, `parse_headings`
+/// and `parse_block_ids` separately, but code blocks are located only once.
+pub fn parse_content(content: &str) -> ParsedContent {
+    // Every element starts with '[', '#' or '^'; plain prose needs no further work
+    if memchr3(b'[', b'#', b'^', content.as_bytes()).is_none() {
+        return ParsedContent::default();
+    }
+
+    let code_ranges = find_code_block_ranges(content);
+
+    ParsedContent {
+        links: parse_all_links_with_ranges(content, &code_ranges),
+        tags: parse_tags_with_ranges(content, &code_ranges),
+        headings: parse_headings_with_ranges(content, &code_ranges),
+        block_ids: parse_block_ids_with_ranges(content, &code_ranges),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::parser::{parse_all_links, parse_block_ids, parse_headings, parse_tags};
+
+    #[test]
+    fn test_parse_content_matches_individual_parsers() {
+        let content = r#"# Title
+
+See [[Other Note|other]] and ![[image.png]] #project/alpha
+
+## Section ^section-id
+
+```
+[[Not A Link]] #not-a-tag
+# Not a heading ^not-a-block
+```
+
+- Item with `[[inline code]]` #tag ^item-id
+"#;
+        let parsed = parse_content(content);
+
+        assert_eq!(parsed.links, parse_all_links(content));
+        assert_eq!(parsed.tags, parse_tags(content));
+        assert_eq!(parsed.headings, parse_headings(content));
+        assert_eq!(parsed.block_ids, parse_block_ids(content));
+
+        assert_eq!(parsed.links.len(), 2);
+        assert_eq!(parsed.headings.len(), 2);
+        assert_eq!(parsed.block_ids.len(), 2);
+    }
+}
@@ -1,7 +1,7 @@
 //! YAML frontmatter parsing.
 
 use crate::error::{Result, VaultError};
-use serde_yaml::Value;
+use serde_yaml::{Mapping, Value};
 use std::path::Path;
 
 /// Frontmatter extraction result.
@@ -111,24 +111,17 @@ pub fn extract_frontmatter(content: &str) -> Option<&str> {
 
 /// Parse frontmatter into a serde_yaml::Value.
 pub fn parse_frontmatter(content: &str) -> Result<Option<Value>> {
-    match extract_frontmatter(content) {
-        Some(yaml) => {
-            let value: Value = serde_yaml::from_str(yaml).map_err(|e| {
-                VaultError::InvalidFrontmatter {
-                    path: Path::new("<unknown>").to_path_buf(),
-                    message: e.to_string(),
-                }
-            })?;
-            Ok(Some(value))
-        }
-        None => Ok(None),
-    }
+    parse_frontmatter_with_path(content, Path::new("<unknown>"))
 }
 
 /// Parse frontmatter with path context for error messages.
 pub fn parse_frontmatter_with_path(content: &str, path: &Path) -> Result<Option<Value>> {
     match extract_frontmatter(content) {
         Some(yaml) => {
+            if let Some(value) = parse_simple_yaml(yaml) {
+                return Ok(Some(value));
+            }
+
             let value: Value = serde_yaml::from_str(yaml).map_err(|e| {
                 VaultError::InvalidFrontmatter {
                     path: path.to_path_buf(),
@@ -141,6 +134,164 @@ pub fn parse_frontmatter_with_path(content: &str, path: &Path) -> Result<Option<
     }
 }
 
+/// Parse the common subset of frontmatter YAML without a full YAML parser.
+///
+/// Handles a flat mapping of `key: scalar` lines and `key:` followed by a
+/// block sequence of scalars (`- item`). Scalars may be plain strings,
+/// integers, `YYYY-MM-DD` dates, booleans, nulls, or quoted strings without
+/// escapes. Returns `None` for anything else, so that serde_yaml can handle
+/// it; whenever a value is returned, it is the one serde_yaml would produce.
+fn parse_simple_yaml(yaml: &str) -> Option<Value> {
+    let mut mapping = Mapping::new();
+    let mut lines = yaml.lines().peekable();
+
+    while let Some(line) = lines.next() {
+        if line.trim().is_empty() {
+            continue;
+        }
+
+        let (key, rest) = line.split_once(':')?;
+        if !is_simple_key(key) {
+            return None;
+        }
+        let key = Value::String(key.to_string());
+        if mapping.contains_key(&key) {
+            return None;
+        }
+
+        let value = match rest.strip_prefix(' ') {
+            // `key:value` is a single plain scalar in YAML, not a pair
+            None if !rest.is_empty() => return None,
+            Some(text) if !text.trim().is_empty() => {
+                if text.starts_with(' ') {
+                    return None;
+                }
+                parse_simple_scalar(text.trim_end())?
+            }
+            // Either a block sequence follows, or the value is null
+            _ => {
+                let mut items = Vec::new();
+                let mut item_indent = None;
+
+                while let Some(next) = lines.peek() {
+                    let trimmed = next.trim_start_matches(' ');
+                    let Some(item) = trimmed.strip_prefix("- ") else {
+                        break;
+                    };
+                    let indent = next.len() - trimmed.len();
+                    if *item_indent.get_or_insert(indent) != indent {
+                        return None;
+                    }
+                    items.push(parse_simple_scalar(item.trim())?);
+                    lines.next();
+                }
+
+                if items.is_empty() {
+                    Value::Null
+                } else {
+                    Value::Sequence(items)
+                }
+            }
+        };
+
+        mapping.insert(key, value);
+    }
+
+    if mapping.is_empty() {
+        return None;
+    }
+    Some(Value::Mapping(mapping))
+}
+
+/// Check that a mapping key is a plain word that YAML reads as a string.
+fn is_simple_key(key: &str) -> bool {
+    let Some(first) = key.chars().next() else {
+        return false;
+    };
+    (first.is_alphabetic() || first == '_')
+        && !key.ends_with(' ')
+        && key
+            .chars()
+            .all(|c| c.is_alphanumeric() || c == '_' || c == '-' || c == ' ')
+        && !is_reserved_word(key)
+}
+
+/// Parse a single-line scalar in the supported subset.
+fn parse_simple_scalar(text: &str) -> Option<Value> {
+    if text.contains('\t') || text.contains('\r') {
+        return None;
+    }
+
+    // Quoted strings, as long as they contain no escapes
+    for quote in ['"', '\''] {
+        if let Some(inner) = text.strip_prefix(quote) {
+            let inner = inner.strip_suffix(quote)?;
+            if inner.contains(quote) || inner.contains('\\') {
+                return None;
+            }
+            return Some(Value::String(inner.to_string()));
+        }
+    }
+
+    match text {
+        "" | "~" | "null" | "Null" | "NULL" => return Some(Value::Null),
+        "true" | "True" | "TRUE" => return Some(Value::Bool(true)),
+        "false" | "False" | "FALSE" => return Some(Value::Bool(false)),
+        _ => {}
+    }
+
+    let bytes = text.as_bytes();
+    if bytes[0].is_ascii_digit() || bytes[0] == b'-' {
+        if is_simple_integer(text) {
+            return text.parse::<i64>().ok().map(Value::from);
+        }
+        if is_iso_date(bytes) {
+            return Some(Value::String(text.to_string()));
+        }
+        return None;
+    }
+
+    // Plain strings: must start with a letter and contain nothing YAML
+    // would read as structure or a comment
+    let first = text.chars().next()?;
+    if !(first.is_alphabetic() || first == '_')
+        || text.contains(": ")
+        || text.contains(" #")
+        || text.ends_with(':')
+        || is_reserved_word(text)
+    {
+        return None;
+    }
+    Some(Value::String(text.to_string()))
+}
+
+/// Words that YAML (or serde_yaml's float parsing) may read as non-strings.
+fn is_reserved_word(text: &str) -> bool {
+    matches!(
+        text.to_ascii_lowercase().as_str(),
+        "null" | "true" | "false" | "y" | "n" | "yes" | "no" | "on" | "off" | "inf" | "infinity" | "nan"
+    )
+}
+
+/// `0` or a non-zero-led decimal integer that fits comfortably in an i64.
+fn is_simple_integer(text: &str) -> bool {
+    let digits = text.strip_prefix('-').unwrap_or(text);
+    text == "0"
+        || (!digits.is_empty()
+            && digits.len() <= 18
+            && !digits.starts_with('0')
+            && digits.bytes().all(|b| b.is_ascii_digit()))
+}
+
+/// `YYYY-MM-DD`, which serde_yaml keeps as a string.
+fn is_iso_date(bytes: &[u8]) -> bool {
+    bytes.len() == 10
+        && bytes.iter().enumerate().all(|(i, b)| match i {
+            4 | 7 => *b == b'-',
+            _ => b.is_ascii_digit(),
+        })
+}
+
 /// Serialize a Value back to YAML frontmatter format (with delimiters).
 pub fn serialize_frontmatter(value: &Value) -> Result<String> {
     let yaml = serde_yaml::to_string(value)?;
@@ -200,6 +351,48 @@ mod tests {
         assert_eq!(tags.len(), 2);
     }
 
+    #[test]
+    fn test_simple_yaml_matches_serde_yaml() {
+        let cases = [
+            "title: My Note\ntags:\n  - rust\n  - cli",
+            "title: Note\naliases:\n- First\n- Second\ncount: 42\nnegative: -7\nzero: 0",
+            "created: 2024-01-15\ndraft: true\npublished: False\nempty:\nnothing: ~",
+            "quoted: \"Hello, world\"\nsingle: 'it is: fine'\n\nspaced key: value with spaces   ",
+            "status: in-progress\nurl_slug: my_note-1\nunicode: Café [draft]",
+        ];
+
+        for yaml in cases {
+            let simple = parse_simple_yaml(yaml)
+                .unwrap_or_else(|| panic!("fast path rejected {:?}", yaml));
+            let expected: Value = serde_yaml::from_str(yaml).unwrap();
+            assert_eq!(simple, expected, "mismatch for {:?}", yaml);
+        }
+    }
+
+    #[test]
+    fn test_simple_yaml_falls_back() {
+        let cases = [
+            "tags: [a, b]",
+            "meta:\n  nested: value",
+            "description: |\n  multi\n  line",
+            "ratio: 1.5",
+            "version: 0123",
+            "answer: yes",
+            "anchor: &a value",
+            "# comment\ntitle: Note",
+            "title: a: b",
+            "title: Note # comment",
+            "escaped: \"line\\nbreak\"",
+            "title: Note\ntitle: Again",
+            "123: numeric key",
+            "",
+        ];
+
+        for yaml in cases {
+            assert!(parse_simple_yaml(yaml).is_none(), "fast path accepted {:?}", yaml);
+        }
+    }
+
     #[test]
     fn test_invalid_frontmatter() {
         let content = "---\ninvalid: yaml: syntax:\n---\nContent";
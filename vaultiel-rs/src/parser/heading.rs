@@ -1,7 +1,8 @@
 //! Heading parsing and slug generation.
 
-use crate::parser::code_block::{find_code_block_ranges, is_line_in_fenced_code_block};
+use crate::parser::code_block::{find_code_block_ranges, is_line_in_fenced_code_block, CodeBlockRange};
 use crate::types::Heading;
+use memchr::memchr;
 use regex::Regex;
 use std::sync::LazyLock;
 use unicode_normalization::UnicodeNormalization;
@@ -13,7 +14,15 @@ static HEADING: LazyLock<Regex> = LazyLock::new(|| {
 
 /// Parse all headings from content.
 pub fn parse_headings(content: &str) -> Vec<Heading> {
-    let code_ranges = find_code_block_ranges(content);
+    // Skip the code block scan entirely for notes without a '#'
+    if memchr(b'#', content.as_bytes()).is_none() {
+        return Vec::new();
+    }
+    parse_headings_with_ranges(content, &find_code_block_ranges(content))
+}
+
+/// Parse all headings, given precomputed code block ranges.
+pub(crate) fn parse_headings_with_ranges(content: &str, code_ranges: &[CodeBlockRange]) -> Vec<Heading> {
     let mut headings = Vec::new();
     let mut slug_counts: std::collections::HashMap<String, usize> =
         std::collections::HashMap::new();
@@ -22,7 +31,7 @@ pub fn parse_headings(content: &str) -> Vec<Heading> {
         let line_num = line_idx + 1; // 1-indexed
 
         // Skip lines inside fenced code blocks
-        if is_line_in_fenced_code_block(line_num, &code_ranges) {
+        if is_line_in_fenced_code_block(line_num, code_ranges) {
             continue;
         }
 
@@ -55,12 +64,21 @@ pub fn parse_headings(content: &str) -> Vec<Heading> {
 /// - Remove special characters (keep alphanumeric, hyphens, underscores)
 /// - Collapse multiple hyphens
 pub fn slugify(text: &str) -> String {
+    // ASCII text is already in NFC; skip the normalization pass and its allocation
+    if text.is_ascii() {
+        return slugify_normalized(text);
+    }
+
     let normalized: String = text.nfc().collect();
+    slugify_normalized(&normalized)
+}
 
-    let mut slug = String::new();
+/// Slugify text that is already NFC-normalized.
+fn slugify_normalized(text: &str) -> String {
+    let mut slug = String::with_capacity(text.len());
     let mut last_was_hyphen = false;
 
-    for c in normalized.chars() {
+    for c in text.chars() {
         if c.is_alphanumeric() {
             slug.push(c.to_ascii_lowercase());
             last_was_hyphen = false;
@@ -206,6 +224,13 @@ mod tests {
         assert_eq!(slugify("Multiple   Spaces"), "multiple-spaces");
     }
 
+    #[test]
+    fn test_slugify_normalizes_non_ascii() {
+        // Decomposed "é" composes to one alphanumeric char instead of losing the accent
+        assert_eq!(slugify("Cafe\u{301} Notes"), "café-notes");
+        assert_eq!(slugify("Café Notes"), "café-notes");
+    }
+
     #[test]
     fn test_duplicate_headings_unique_slugs() {
         let content = "# Test\n\n## Test\n\n### Test";
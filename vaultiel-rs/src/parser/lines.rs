@@ -0,0 +1,58 @@
+//! Incremental line/column tracking for byte offsets.
+
+use memchr::{memchr_iter, memrchr};
+
+/// Maps increasing byte offsets to line numbers and line starts.
+///
+/// Parsers visit matches in order, so each lookup only scans the bytes since
+/// the previous one instead of recounting newlines from the start of content.
+pub(crate) struct LineCursor<'a> {
+    bytes: &'a [u8],
+    pos: usize,
+    line: usize,
+    line_start: usize,
+}
+
+impl<'a> LineCursor<'a> {
+    pub(crate) fn new(content: &'a str) -> Self {
+        Self {
+            bytes: content.as_bytes(),
+            pos: 0,
+            line: 1,
+            line_start: 0,
+        }
+    }
+
+    /// Return the 1-indexed line number and the byte offset of that line's start.
+    ///
+    /// `offset` must not be smaller than the offset of the previous call.
+    pub(crate) fn locate(&mut self, offset: usize) -> (usize, usize) {
+        debug_assert!(offset >= self.pos, "LineCursor offsets must not decrease");
+
+        let skipped = &self.bytes[self.pos..offset];
+        if let Some(last) = memrchr(b'\n', skipped) {
+            self.line += memchr_iter(b'\n', skipped).count();
+            self.line_start = self.pos + last + 1;
+        }
+        self.pos = offset;
+
+        (self.line, self.line_start)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_line_cursor_matches_naive_count() {
+        let content = "first\nsecond line\n\nfourth [[x]]\nlast";
+        let mut cursor = LineCursor::new(content);
+
+        for offset in [0, 3, 6, 10, 18, 19, 26, 33, content.len()] {
+            let line = content[..offset].matches('\n').count() + 1;
+            let line_start = content[..offset].rfind('\n').map(|i| i + 1).unwrap_or(0);
+            assert_eq!(cursor.locate(offset), (line, line_start), "offset {}", offset);
+        }
+    }
+}
@@ -2,15 +2,18 @@
 
 pub mod block_id;
 pub mod code_block;
+pub mod content;
 pub mod frontmatter;
 pub mod heading;
 pub mod inline_property;
+mod lines;
 pub mod tag;
 pub mod task;
 pub mod wikilink;
 
 pub use block_id::parse_block_ids;
 pub use code_block::{find_code_block_ranges, CodeBlockRange};
+pub use content::{parse_content, ParsedContent};
 pub use frontmatter::{
     extract_frontmatter, parse_frontmatter, parse_frontmatter_with_path,
     serialize_frontmatter, split_frontmatter, update_frontmatter,
@@ -1,7 +1,9 @@
 //! Tag parsing (#tag and #tag/subtag).
 
-use crate::parser::code_block::{find_code_block_ranges, is_in_code_block};
+use crate::parser::code_block::{find_code_block_ranges, is_in_code_block, CodeBlockRange};
+use crate::parser::lines::LineCursor;
 use crate::types::Tag;
+use memchr::{memchr, memmem};
 use regex::Regex;
 use std::sync::LazyLock;
 
@@ -19,8 +21,17 @@ static TAG: LazyLock<Regex> = LazyLock::new(|| {
 
 /// Parse all tags from content.
 pub fn parse_tags(content: &str) -> Vec<Tag> {
-    let code_ranges = find_code_block_ranges(content);
+    // Skip the code block scan entirely for notes without a '#'
+    if memchr(b'#', content.as_bytes()).is_none() {
+        return Vec::new();
+    }
+    parse_tags_with_ranges(content, &find_code_block_ranges(content))
+}
+
+/// Parse all tags, given precomputed code block ranges.
+pub(crate) fn parse_tags_with_ranges(content: &str, code_ranges: &[CodeBlockRange]) -> Vec<Tag> {
     let mut tags = Vec::new();
+    let mut lines = LineCursor::new(content);
 
     for cap in TAG.captures_iter(content) {
         // Group 1 is the tag name (without #)
@@ -39,7 +50,7 @@ pub fn parse_tags(content: &str) -> Vec<Tag> {
         }
 
         // Skip if inside code block
-        if is_in_code_block(start, &code_ranges) {
+        if is_in_code_block(start, code_ranges) {
             continue;
         }
 
@@ -50,11 +61,8 @@ pub fn parse_tags(content: &str) -> Vec<Tag> {
 
         let tag_name = format!("#{}", tag_match.as_str());
 
-        // Calculate line number
-        let line = content[..start].matches('\n').count() + 1;
-
-        // Calculate column
-        let line_start = content[..start].rfind('\n').map(|i| i + 1).unwrap_or(0);
+        // Calculate line number and column
+        let (line, line_start) = lines.locate(start);
         let start_col = start - line_start;
         let end_col = end - line_start;
 
@@ -71,27 +79,27 @@ pub fn parse_tags(content: &str) -> Vec<Tag> {
 
 /// Check if a position is inside a wikilink.
 fn is_in_wikilink(content: &str, pos: usize) -> bool {
-    let before = &content[..pos];
-    let after = &content[pos..];
+    let before = content[..pos].as_bytes();
+    let after = content[pos..].as_bytes();
 
     // Find the last [[ before this position
-    let last_open = before.rfind("[[");
+    let last_open = memmem::rfind(before, b"[[");
     // Find the last ]] before this position
-    let last_close = before.rfind("]]");
+    let last_close = memmem::rfind(before, b"]]");
 
     match (last_open, last_close) {
         (Some(open), Some(close)) => {
             // We're inside if [[ is after ]] (or they're nested somehow)
             if open > close {
                 // Check if there's a ]] after our position
-                after.find("]]").is_some()
+                memmem::find(after, b"]]").is_some()
             } else {
                 false
             }
         }
         (Some(_), None) => {
             // There's an open but no close before us, check for close after
-            after.find("]]").is_some()
+            memmem::find(after, b"]]").is_some()
         }
         _ => false,
     }
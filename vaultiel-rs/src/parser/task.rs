@@ -352,66 +352,41 @@ pub fn build_task_hierarchy(tasks: Vec<Task>) -> Vec<HierarchicalTask> {
 }
 
 /// Build hierarchy for tasks within a single file.
+///
+/// Parents always precede their children, so one forward pass records each
+/// task's parent, and one backward pass moves every finished subtree into its
+/// parent. Tasks whose parent is unknown become top-level.
 fn build_file_hierarchy(tasks: Vec<Task>) -> Vec<HierarchicalTask> {
-    let mut result: Vec<HierarchicalTask> = Vec::new();
-    let mut task_map: HashMap<usize, usize> = HashMap::new(); // line -> index in result
-
-    for task in tasks {
-        let line = task.location.line;
-        let parent_line = task.parent_line;
-        let h_task: HierarchicalTask = task.into();
-
-        if let Some(parent_ln) = parent_line {
-            // Find parent and add as child
-            if let Some(&parent_idx) = task_map.get(&parent_ln) {
-                add_child_to_tree(&mut result, parent_idx, h_task.clone());
-            } else {
-                // Parent not found, add as top-level
-                task_map.insert(line, result.len());
-                result.push(h_task);
-            }
-        } else {
-            // Top-level task
-            task_map.insert(line, result.len());
-            result.push(h_task);
-        }
+    let mut index_by_line: HashMap<usize, usize> = HashMap::with_capacity(tasks.len());
+    let mut parents: Vec<Option<usize>> = Vec::with_capacity(tasks.len());
+    let mut nodes: Vec<Option<HierarchicalTask>> = Vec::with_capacity(tasks.len());
+
+    for (idx, task) in tasks.into_iter().enumerate() {
+        let parent = task
+            .parent_line
+            .and_then(|parent_ln| index_by_line.get(&parent_ln).copied());
+        index_by_line.insert(task.location.line, idx);
+        parents.push(parent);
+        nodes.push(Some(task.into()));
     }
 
-    result
-}
+    // Walk backwards: all of a task's children are attached before it is moved
+    let mut result = Vec::new();
+    for idx in (0..nodes.len()).rev() {
+        let Some(mut node) = nodes[idx].take() else {
+            continue;
+        };
+        // Children were attached last-first
+        node.children.reverse();
 
-/// Add a child task to the tree at the correct parent.
-fn add_child_to_tree(
-    result: &mut [HierarchicalTask],
-    parent_idx: usize,
-    child: HierarchicalTask,
-) {
-    // Find the actual parent (might be nested deeper)
-    fn find_and_add(
-        children: &mut [TaskChild],
-        parent_line: usize,
-        child: HierarchicalTask,
-    ) -> bool {
-        for tc in children.iter_mut() {
-            if let TaskChild::Task(task) = tc {
-                if task.location.line == parent_line {
-                    task.children.push(TaskChild::Task(child));
-                    return true;
-                }
-                if find_and_add(&mut task.children, parent_line, child.clone()) {
-                    return true;
-                }
-            }
+        match parents[idx].and_then(|parent_idx| nodes[parent_idx].as_mut()) {
+            Some(parent) => parent.children.push(TaskChild::Task(node)),
+            None => result.push(node),
         }
-        false
     }
+    result.reverse();
 
-    let parent = &mut result[parent_idx];
-    if parent.location.line == child.parent_line.unwrap_or(0) {
-        parent.children.push(TaskChild::Task(child));
-    } else if !find_and_add(&mut parent.children, child.parent_line.unwrap_or(0), child.clone()) {
-        parent.children.push(TaskChild::Task(child));
-    }
+    result
 }
 
 /// Parse task trees from content, including non-task list items as children.
@@ -1040,6 +1015,36 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_build_task_hierarchy_nested() {
+        let content = "- [ ] Root\n    - [ ] Child\n        - [ ] Grandchild\n    - [ ] Second child\n- [ ] Other root";
+        let path = PathBuf::from("test.md");
+        let tasks = parse_tasks(content, &path, &obsidian_tasks_config());
+
+        let hierarchy = build_task_hierarchy(tasks);
+
+        assert_eq!(hierarchy.len(), 2);
+        assert_eq!(hierarchy[0].description, "Root");
+        assert_eq!(hierarchy[1].description, "Other root");
+
+        let children: Vec<&HierarchicalTask> = hierarchy[0]
+            .children
+            .iter()
+            .filter_map(|c| match c {
+                TaskChild::Task(t) => Some(t),
+                _ => None,
+            })
+            .collect();
+        assert_eq!(children.len(), 2);
+        assert_eq!(children[0].description, "Child");
+        assert_eq!(children[1].description, "Second child");
+
+        match &children[0].children[..] {
+            [TaskChild::Task(grandchild)] => assert_eq!(grandchild.description, "Grandchild"),
+            other => panic!("Expected one grandchild, got {:?}", other),
+        }
+    }
+
     #[test]
     fn test_parse_tasks_with_different_markers() {
         let content = "* [ ] Star task\n+ [ ] Plus task\n1. [ ] Numbered task";
@@ -1,7 +1,9 @@
 //! Wikilink and embed parsing.
 
-use crate::parser::code_block::{find_code_block_ranges, is_in_code_block};
+use crate::parser::code_block::{find_code_block_ranges, is_in_code_block, CodeBlockRange};
+use crate::parser::lines::LineCursor;
 use crate::types::Link;
+use memchr::memmem;
 use regex::Regex;
 use std::sync::LazyLock;
 
@@ -44,8 +46,17 @@ pub fn parse_embeds(content: &str) -> Vec<Link> {
 
 /// Parse all wikilinks and embeds from content.
 pub fn parse_all_links(content: &str) -> Vec<Link> {
-    let code_ranges = find_code_block_ranges(content);
+    // Skip the code block scan entirely for notes without links
+    if !has_link_marker(content) {
+        return Vec::new();
+    }
+    parse_all_links_with_ranges(content, &find_code_block_ranges(content))
+}
+
+/// Parse all wikilinks and embeds, given precomputed code block ranges.
+pub(crate) fn parse_all_links_with_ranges(content: &str, code_ranges: &[CodeBlockRange]) -> Vec<Link> {
     let mut links = Vec::new();
+    let mut lines = LineCursor::new(content);
 
     for cap in WIKILINK.captures_iter(content) {
         let full_match = cap.get(0).unwrap();
@@ -53,7 +64,7 @@ pub fn parse_all_links(content: &str) -> Vec<Link> {
         let end = full_match.end();
 
         // Skip if inside code block
-        if is_in_code_block(start, &code_ranges) {
+        if is_in_code_block(start, code_ranges) {
             continue;
         }
 
@@ -63,11 +74,8 @@ pub fn parse_all_links(content: &str) -> Vec<Link> {
         let heading = cap.get(4).map(|m| m.as_str().to_string());
         let alias = cap.get(5).map(|m| m.as_str().to_string());
 
-        // Calculate line number
-        let line = content[..start].matches('\n').count() + 1;
-
-        // Calculate column
-        let line_start = content[..start].rfind('\n').map(|i| i + 1).unwrap_or(0);
+        // Calculate line number and column
+        let (line, line_start) = lines.locate(start);
         let start_col = start - line_start;
         let end_col = end - line_start;
 
@@ -86,6 +94,11 @@ pub fn parse_all_links(content: &str) -> Vec<Link> {
     links
 }
 
+/// Check whether content contains a `[[` that could open a wikilink or embed.
+fn has_link_marker(content: &str) -> bool {
+    memmem::find(content.as_bytes(), b"[[").is_some()
+}
+
 /// Check if a string looks like an image or media embed.
 pub fn is_media_embed(target: &str) -> bool {
     let lower = target.to_lowercase();
@@ -243,6 +243,66 @@ pub struct Task {
     pub block_id: Option<String>,
 }
 
+/// Criteria for selecting tasks. The default filter matches every task.
+///
+/// All criteria must hold for a task to match. Metadata comparisons are plain
+/// string comparisons, which order ISO dates (YYYY-MM-DD) chronologically.
+#[derive(Debug, Clone, Default, PartialEq, Eq, Serialize, Deserialize)]
+pub struct TaskFilter {
+    /// Required task symbol (e.g., "[ ]").
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub symbol: Option<String>,
+
+    /// Metadata fields that must be present.
+    #[serde(default, skip_serializing_if = "Vec::is_empty")]
+    pub has_fields: Vec<String>,
+
+    /// Metadata fields that must equal the given value.
+    #[serde(default, skip_serializing_if = "std::collections::HashMap::is_empty")]
+    pub field_equals: std::collections::HashMap<String, String>,
+
+    /// Metadata fields that must be present and sort strictly before the given value.
+    #[serde(default, skip_serializing_if = "std::collections::HashMap::is_empty")]
+    pub field_before: std::collections::HashMap<String, String>,
+
+    /// Only match tasks containing at least one tag.
+    #[serde(default)]
+    pub has_tags: bool,
+
+    /// Only match tasks with a block ID.
+    #[serde(default)]
+    pub has_block_id: bool,
+}
+
+impl TaskFilter {
+    /// Check whether a task satisfies every criterion of the filter.
+    pub fn matches(&self, task: &Task) -> bool {
+        if let Some(ref symbol) = self.symbol {
+            if task.symbol != *symbol {
+                return false;
+            }
+        }
+        if self.has_tags && task.tags.is_empty() {
+            return false;
+        }
+        if self.has_block_id && task.block_id.is_none() {
+            return false;
+        }
+        if !self.has_fields.iter().all(|f| task.metadata.contains_key(f)) {
+            return false;
+        }
+        let field_equals = self
+            .field_equals
+            .iter()
+            .all(|(f, v)| task.metadata.get(f) == Some(v));
+        let field_before = self
+            .field_before
+            .iter()
+            .all(|(f, v)| task.metadata.get(f).is_some_and(|m| m < v));
+        field_equals && field_before
+    }
+}
+
 /// Location of a task in the vault.
 #[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
 pub struct TaskLocation {
@@ -422,6 +482,77 @@ mod tests {
         assert_eq!(tag.ancestors(), vec!["#a", "#a/b"]);
     }
 
+    fn filter_test_task(symbol: &str, metadata: &[(&str, &str)]) -> Task {
+        Task {
+            location: TaskLocation {
+                file: std::path::PathBuf::from("note.md"),
+                line: 1,
+            },
+            raw: String::new(),
+            marker: "-".to_string(),
+            symbol: symbol.to_string(),
+            description: "Task".to_string(),
+            indent: 0,
+            parent_line: None,
+            metadata: metadata
+                .iter()
+                .map(|(k, v)| (k.to_string(), v.to_string()))
+                .collect(),
+            links: Vec::new(),
+            tags: Vec::new(),
+            block_id: None,
+        }
+    }
+
+    #[test]
+    fn test_task_filter_default_matches_all() {
+        let task = filter_test_task("[x]", &[]);
+        assert!(TaskFilter::default().matches(&task));
+    }
+
+    #[test]
+    fn test_task_filter_symbol_and_fields() {
+        let task = filter_test_task("[ ]", &[("due", "2024-02-15"), ("priority", "high")]);
+
+        let mut filter = TaskFilter {
+            symbol: Some("[ ]".to_string()),
+            ..Default::default()
+        };
+        filter.field_equals.insert("priority".to_string(), "high".to_string());
+        filter.field_before.insert("due".to_string(), "2024-03-01".to_string());
+        assert!(filter.matches(&task));
+
+        filter.field_before.insert("due".to_string(), "2024-02-15".to_string());
+        assert!(!filter.matches(&task));
+
+        let missing = TaskFilter {
+            has_fields: vec!["scheduled".to_string()],
+            ..Default::default()
+        };
+        assert!(!missing.matches(&task));
+
+        let done = TaskFilter {
+            symbol: Some("[x]".to_string()),
+            ..Default::default()
+        };
+        assert!(!done.matches(&task));
+    }
+
+    #[test]
+    fn test_task_filter_tags_and_block_id() {
+        let mut task = filter_test_task("[ ]", &[]);
+        let filter = TaskFilter {
+            has_tags: true,
+            has_block_id: true,
+            ..Default::default()
+        };
+        assert!(!filter.matches(&task));
+
+        task.tags.push("#urgent".to_string());
+        task.block_id = Some("abc".to_string());
+        assert!(filter.matches(&task));
+    }
+
     #[test]
     fn test_link_full_target() {
         let link = Link {
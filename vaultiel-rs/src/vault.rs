@@ -3,8 +3,10 @@
 use crate::error::{Result, VaultError};
 use crate::note::{Note, NoteInfo};
 use crate::search::{evaluate_note, parse_query, SearchQuery, SearchResult};
-use glob::glob;
+use glob::{MatchOptions, Pattern};
 use std::path::{Component, Path, PathBuf};
+use std::sync::{Arc, Mutex, MutexGuard, PoisonError};
+use std::time::SystemTime;
 
 /// Characters that are illegal inside a single filename component on at least
 /// one of the target filesystems (macOS / Android FAT-exFAT / Linux / Windows).
@@ -33,11 +35,131 @@ fn validate_note_path(relative_path: &Path) -> Result<()> {
     Ok(())
 }
 
+/// Cached result of walking the vault for notes.
+///
+/// Creating, deleting or renaming an entry updates the mtime of its parent
+/// directory, so the listing stays valid for as long as every walked
+/// directory still has the mtime recorded during the walk.
+#[derive(Debug, Default)]
+struct NoteListCache {
+    /// Sorted relative paths of all notes.
+    notes: Vec<PathBuf>,
+    /// Every directory visited by the walk, with its mtime at the time.
+    dir_mtimes: Vec<(PathBuf, SystemTime)>,
+}
+
+impl NoteListCache {
+    /// Walk the vault for `.md` files, skipping hidden files and directories.
+    fn walk(root: &Path) -> Result<Self> {
+        let mut cache = Self::default();
+        let mut pending = vec![root.to_path_buf()];
+
+        while let Some(dir) = pending.pop() {
+            // Record the mtime before reading, so changes made during the
+            // read are picked up by the next freshness check
+            let listing = std::fs::metadata(&dir)
+                .and_then(|m| m.modified())
+                .and_then(|mtime| Ok((mtime, std::fs::read_dir(&dir)?)));
+
+            let (mtime, entries) = match listing {
+                Ok(listing) => listing,
+                Err(e) if dir != root => {
+                    // Log but continue on unreadable subdirectories
+                    eprintln!("Warning: cannot read {}: {}", dir.display(), e);
+                    continue;
+                }
+                Err(e) => return Err(e.into()),
+            };
+            cache.dir_mtimes.push((dir.clone(), mtime));
+
+            for entry in entries.flatten() {
+                if entry.file_name().to_string_lossy().starts_with('.') {
+                    continue;
+                }
+
+                let path = entry.path();
+                let mut file_type = entry.file_type()?;
+                if file_type.is_symlink() {
+                    // Follow symlinks, as glob does
+                    match std::fs::metadata(&path) {
+                        Ok(meta) => file_type = meta.file_type(),
+                        Err(_) => continue,
+                    }
+                }
+
+                if file_type.is_dir() {
+                    pending.push(path);
+                } else if file_type.is_file() && path.extension().is_some_and(|e| e == "md") {
+                    if let Ok(relative) = path.strip_prefix(root) {
+                        cache.notes.push(relative.to_path_buf());
+                    }
+                }
+            }
+        }
+
+        // Sort by path
+        cache.notes.sort();
+
+        Ok(cache)
+    }
+
+    /// Check that no walked directory has changed since the walk.
+    fn is_fresh(&self) -> bool {
+        self.dir_mtimes.iter().all(|(dir, mtime)| {
+            std::fs::metadata(dir)
+                .and_then(|m| m.modified())
+                .is_ok_and(|m| m == *mtime)
+        })
+    }
+}
+
+/// A compiled set of glob patterns for filtering note paths.
+///
+/// Patterns are relative to the vault root. As in shell globs, `*` and `?`
+/// do not match `/`; use `**` to match across folders.
+#[derive(Debug, Clone)]
+pub struct GlobMatcher {
+    patterns: Vec<Pattern>,
+}
+
+impl GlobMatcher {
+    const OPTIONS: MatchOptions = MatchOptions {
+        case_sensitive: true,
+        require_literal_separator: true,
+        require_literal_leading_dot: false,
+    };
+
+    /// Compile a matcher that accepts paths matching any of `patterns`.
+    pub fn new<S: AsRef<str>>(patterns: &[S]) -> Result<Self> {
+        let patterns = patterns
+            .iter()
+            .map(|p| Pattern::new(p.as_ref()))
+            .collect::<std::result::Result<_, _>>()?;
+        Ok(Self { patterns })
+    }
+
+    /// Check whether a vault-relative path matches any pattern.
+    pub fn is_match(&self, path: &Path) -> bool {
+        self.patterns
+            .iter()
+            .any(|p| p.matches_path_with(path, Self::OPTIONS))
+    }
+
+    /// List the notes in `vault` that match any pattern, sorted by path.
+    pub fn list(&self, vault: &Vault) -> Result<Vec<PathBuf>> {
+        let mut notes = vault.list_notes()?;
+        notes.retain(|path| self.is_match(path));
+        Ok(notes)
+    }
+}
+
 /// Represents an Obsidian vault.
 #[derive(Debug, Clone)]
 pub struct Vault {
     /// Root path of the vault.
     pub root: PathBuf,
+    /// Cached note listing, shared between clones of this vault.
+    note_cache: Arc<Mutex<Option<NoteListCache>>>,
 }
 
 impl Vault {
@@ -49,7 +171,25 @@ impl Vault {
             return Err(VaultError::VaultNotFound(root));
         }
 
-        Ok(Self { root })
+        Ok(Self {
+            root,
+            note_cache: Arc::default(),
+        })
+    }
+
+    /// Forget the cached note listing.
+    ///
+    /// Changes made through this `Vault` invalidate the cache automatically,
+    /// and external changes are detected through directory mtimes. Call this
+    /// after external changes that may fall within the filesystem's mtime
+    /// resolution.
+    pub fn invalidate_cache(&self) {
+        *self.lock_note_cache() = None;
+    }
+
+    fn lock_note_cache(&self) -> MutexGuard<'_, Option<NoteListCache>> {
+        // The cache holds no invariants a panicking walk could break
+        self.note_cache.lock().unwrap_or_else(PoisonError::into_inner)
     }
 
     /// Get the full path to a note.
@@ -80,9 +220,24 @@ impl Vault {
         Note::load(&self.root, relative_path)
     }
 
+    /// Load only a note's frontmatter, without reading the body.
+    ///
+    /// See [`Note::load_frontmatter_only`]; body-related methods on the
+    /// returned note are not meaningful.
+    pub fn load_note_frontmatter(&self, relative_path: &Path) -> Result<Note> {
+        if !self.note_exists(relative_path) {
+            return Err(VaultError::NoteNotFound(relative_path.to_path_buf()));
+        }
+        Note::load_frontmatter_only(&self.root, relative_path)
+    }
+
     /// Save a note to the vault.
     pub fn save_note(&self, note: &Note) -> Result<()> {
-        note.save(&self.root)
+        let result = note.save(&self.root);
+        // Saving may create a new note. Invalidate after the write so a
+        // listing taken while it was in progress is not kept.
+        self.invalidate_cache();
+        result
     }
 
     /// Create a new note.
@@ -114,7 +269,9 @@ impl Vault {
         }
 
         let full_path = self.note_path(relative_path);
-        std::fs::remove_file(full_path)?;
+        let result = std::fs::remove_file(full_path);
+        self.invalidate_cache();
+        result?;
         Ok(())
     }
 
@@ -137,68 +294,36 @@ impl Vault {
             std::fs::create_dir_all(parent)?;
         }
 
-        std::fs::rename(from_full, to_full)?;
+        let result = std::fs::rename(from_full, to_full);
+        self.invalidate_cache();
+        result?;
         Ok(())
     }
 
     /// List all markdown files in the vault.
+    ///
+    /// The listing is cached and only re-walked when a directory in the vault
+    /// has changed since the previous walk.
     pub fn list_notes(&self) -> Result<Vec<PathBuf>> {
-        let pattern = self.root.join("**/*.md");
-        let pattern_str = pattern.to_string_lossy();
-
-        let mut notes = Vec::new();
-
-        for entry in glob(&pattern_str)? {
-            match entry {
-                Ok(path) => {
-                    // Get relative path
-                    if let Ok(relative) = path.strip_prefix(&self.root) {
-                        // Skip hidden files and directories
-                        if !relative
-                            .components()
-                            .any(|c| c.as_os_str().to_string_lossy().starts_with('.'))
-                        {
-                            notes.push(relative.to_path_buf());
-                        }
-                    }
-                }
-                Err(e) => {
-                    // Log but continue on glob errors
-                    eprintln!("Warning: glob error: {}", e);
-                }
-            }
+        let mut cache = self.lock_note_cache();
+
+        if let Some(cached) = cache.as_ref().filter(|c| c.is_fresh()) {
+            return Ok(cached.notes.clone());
         }
 
-        // Sort by path
-        notes.sort();
+        let fresh = NoteListCache::walk(&self.root)?;
+        let notes = fresh.notes.clone();
+        *cache = Some(fresh);
 
         Ok(notes)
     }
 
     /// List notes matching a glob pattern.
+    ///
+    /// The pattern is matched against the (cached) note listing. Use a
+    /// [`GlobMatcher`] to reuse compiled patterns across calls.
     pub fn list_notes_matching(&self, pattern: &str) -> Result<Vec<PathBuf>> {
-        let full_pattern = self.root.join(pattern);
-        let pattern_str = full_pattern.to_string_lossy();
-
-        let mut notes = Vec::new();
-
-        for entry in glob(&pattern_str)? {
-            match entry {
-                Ok(path) => {
-                    if path.is_file() && path.extension().map(|e| e == "md").unwrap_or(false) {
-                        if let Ok(relative) = path.strip_prefix(&self.root) {
-                            notes.push(relative.to_path_buf());
-                        }
-                    }
-                }
-                Err(e) => {
-                    eprintln!("Warning: glob error: {}", e);
-                }
-            }
-        }
-
-        notes.sort();
-        Ok(notes)
+        GlobMatcher::new(&[pattern])?.list(self)
     }
 
     /// Get note info for a path.
@@ -329,6 +454,35 @@ mod tests {
         assert_eq!(note.content, "Hello, world!");
     }
 
+    #[test]
+    fn test_load_missing_note_fails() {
+        let (_dir, vault) = setup_test_vault();
+        vault.create_note(&PathBuf::from("sub/a.md"), "A").unwrap();
+
+        for path in ["missing.md", "sub"] {
+            let result = vault.load_note(&PathBuf::from(path));
+            assert!(matches!(result, Err(VaultError::NoteNotFound(_))), "{}", path);
+        }
+        for path in ["missing.md", "sub"] {
+            let result = vault.load_note_frontmatter(&PathBuf::from(path));
+            assert!(matches!(result, Err(VaultError::NoteNotFound(_))), "{}", path);
+        }
+    }
+
+    #[test]
+    fn test_load_note_frontmatter() {
+        let (_dir, vault) = setup_test_vault();
+        let path = PathBuf::from("fm.md");
+        vault
+            .create_note(&path, "---\ntitle: Test\n---\n\nLong body [[Link]]")
+            .unwrap();
+
+        let note = vault.load_note_frontmatter(&path).unwrap();
+        let fm = note.frontmatter().unwrap().unwrap();
+        assert_eq!(fm["title"].as_str(), Some("Test"));
+        assert!(!note.content.contains("Long body"));
+    }
+
     #[test]
     fn test_create_note_in_subdirectory() {
         let (_dir, vault) = setup_test_vault();
@@ -464,6 +618,79 @@ mod tests {
         assert_eq!(notes.len(), 3);
     }
 
+    #[test]
+    fn test_list_notes_skips_hidden() {
+        let (dir, vault) = setup_test_vault();
+
+        vault.create_note(&PathBuf::from("a.md"), "A").unwrap();
+        std::fs::create_dir_all(dir.path().join(".obsidian")).unwrap();
+        std::fs::write(dir.path().join(".obsidian/hidden.md"), "H").unwrap();
+        std::fs::write(dir.path().join(".hidden.md"), "H").unwrap();
+        std::fs::write(dir.path().join("image.png"), "").unwrap();
+
+        let notes = vault.list_notes().unwrap();
+        assert_eq!(notes, vec![PathBuf::from("a.md")]);
+    }
+
+    #[test]
+    fn test_list_notes_cache_invalidation() {
+        let (dir, vault) = setup_test_vault();
+
+        vault.create_note(&PathBuf::from("a.md"), "A").unwrap();
+        assert_eq!(vault.list_notes().unwrap().len(), 1);
+
+        // Changes through the vault invalidate the cache once they are on
+        // disk, so no listing taken before or during the change survives it
+        let is_cached = || vault.lock_note_cache().is_some();
+
+        vault.create_note(&PathBuf::from("sub/b.md"), "B").unwrap();
+        assert!(!is_cached());
+        assert_eq!(vault.list_notes().unwrap().len(), 2);
+
+        vault
+            .rename_note(&PathBuf::from("sub/b.md"), &PathBuf::from("c.md"))
+            .unwrap();
+        assert!(!is_cached());
+        assert_eq!(
+            vault.list_notes().unwrap(),
+            vec![PathBuf::from("a.md"), PathBuf::from("c.md")]
+        );
+
+        vault.delete_note(&PathBuf::from("a.md")).unwrap();
+        assert!(!is_cached());
+        assert_eq!(vault.list_notes().unwrap(), vec![PathBuf::from("c.md")]);
+
+        // External changes are picked up after an explicit invalidation
+        std::fs::write(dir.path().join("external.md"), "E").unwrap();
+        vault.invalidate_cache();
+        assert_eq!(vault.list_notes().unwrap().len(), 2);
+    }
+
+    #[test]
+    fn test_list_notes_matching() {
+        let (_dir, vault) = setup_test_vault();
+
+        vault.create_note(&PathBuf::from("Project Notes.md"), "P").unwrap();
+        vault.create_note(&PathBuf::from("Projects/Alpha.md"), "A").unwrap();
+        vault.create_note(&PathBuf::from("Other.md"), "O").unwrap();
+
+        assert_eq!(
+            vault.list_notes_matching("Project*").unwrap(),
+            vec![PathBuf::from("Project Notes.md")]
+        );
+        assert_eq!(
+            vault.list_notes_matching("Projects/*.md").unwrap(),
+            vec![PathBuf::from("Projects/Alpha.md")]
+        );
+
+        let matcher = GlobMatcher::new(&["Other.md", "**/Alpha.md"]).unwrap();
+        assert_eq!(
+            matcher.list(&vault).unwrap(),
+            vec![PathBuf::from("Other.md"), PathBuf::from("Projects/Alpha.md")]
+        );
+        assert!(GlobMatcher::new(&["[invalid"]).is_err());
+    }
+
     #[test]
     fn test_normalize_note_path() {
         let (_dir, vault) = setup_test_vault();